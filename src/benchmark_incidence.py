@@ -0,0 +1,75 @@
+import random
+import timeit
+
+from models.graph.graph_components.edge import Edge
+from models.graph.graph_components.vertex import Vertex
+from models.graph.graph_representations.incidence.incidence_representation import IncidenceRepresentation
+
+QUANTITY_OF_VERTICES = 10_000
+QUANTITY_OF_EDGES = 40_000
+QUANTITY_OF_QUERIES = 200
+SEED = 42
+
+# Compara as consultas da representação de incidência com a estratégia antiga, em que cada vértice guardava
+# um set de tuplas e as consultas percorriam as arestas incidentes (ou todos os vértices) procurando a aresta.
+
+def build_scan_incidence(edges: list[Edge]) -> dict[Vertex, set[Edge]]:
+    incidence = {vertex: set() for vertex in range(QUANTITY_OF_VERTICES)}
+    for edge in edges:
+        incidence[edge[0]].add(edge)
+        incidence[edge[1]].add(edge)
+    return incidence
+
+def scan_edge_exists(incidence: dict[Vertex, set[Edge]], edge: Edge) -> bool:
+    inverted_edge = (edge[1], edge[0])
+    for incident_edges in incidence.values():
+        if edge in incident_edges or inverted_edge in incident_edges:
+            return True
+    return False
+
+def scan_is_adjacent_vertex(incidence: dict[Vertex, set[Edge]], vertex_a: Vertex, vertex_b: Vertex) -> bool:
+    for v1, v2 in incidence[vertex_a]:
+        if v1 == vertex_b or v2 == vertex_b:
+            return True
+    return False
+
+def scan_is_adjacent_edges(incidence: dict[Vertex, set[Edge]], edge_a: Edge, edge_b: Edge) -> bool:
+    for incident_edges in incidence.values():
+        if edge_a in incident_edges and edge_b in incident_edges:
+            return True
+    return False
+
+def main():
+    rng = random.Random(SEED)
+    edges = set()
+    while len(edges) < QUANTITY_OF_EDGES:
+        vertex_a, vertex_b = rng.randrange(QUANTITY_OF_VERTICES), rng.randrange(QUANTITY_OF_VERTICES)
+        if vertex_a != vertex_b:
+            edges.add((min(vertex_a, vertex_b), max(vertex_a, vertex_b)))
+    edges = sorted(edges)
+    queries = [rng.choice(edges) for _ in range(QUANTITY_OF_QUERIES)]
+
+    representation = IncidenceRepresentation(QUANTITY_OF_VERTICES)
+    representation.create_edges(edges)
+    incidence = build_scan_incidence(edges)
+
+    benchmarks = [
+        ("edge_exists",
+         lambda: [scan_edge_exists(incidence, edge) for edge in queries],
+         lambda: [representation.edge_exists(edge) for edge in queries]),
+        ("is_adjacent_vertex",
+         lambda: [scan_is_adjacent_vertex(incidence, *edge) for edge in queries],
+         lambda: [representation.is_adjacent_vertex(*edge) for edge in queries]),
+        ("is_adjacent_edges",
+         lambda: [scan_is_adjacent_edges(incidence, edge, edges[0]) for edge in queries],
+         lambda: [representation.is_adjacent_edges(edge, edges[0]) for edge in queries]),
+    ]
+
+    print(f"{QUANTITY_OF_VERTICES} vértices, {QUANTITY_OF_EDGES} arestas, {QUANTITY_OF_QUERIES} consultas")
+    for name, scan, indexed in benchmarks:
+        scan_time = min(timeit.repeat(scan, number=1, repeat=3))
+        indexed_time = min(timeit.repeat(indexed, number=1, repeat=3))
+        print(f"{name:<20} varredura: {scan_time * 1000:9.2f} ms  índice: {indexed_time * 1000:7.3f} ms  ({scan_time / indexed_time:,.0f}x)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+import random
+
+from models.graph.graph import Graph
+from models.graph.graph_components.vertex import Vertex
+from models.graph.graph_representations.graph_representations_types import GraphRepresentationType
+
+QUANTITY_OF_TRIALS = 400
+MAX_VERTICES = 25
+MAX_OPERATIONS = 120
+SEED = 7
+
+# Confere os componentes mantidos incrementalmente pelo grafo (union-find com remoções) contra uma busca em largura
+# feita do zero, depois de sequências aleatórias de criação/remoção de arestas e inclusão de vértices,
+# para cada conjunto de representações declaradas (inclusive os que não têm lista de adjacência nem CSR).
+
+REPRESENTATION_SETS = [
+    None,
+    {GraphRepresentationType.INCIDENCE},
+    {GraphRepresentationType.ADJACENCY_MATRIX},
+    {GraphRepresentationType.ADJACENCY_LIST},
+    {GraphRepresentationType.CSR},
+    {GraphRepresentationType.INCIDENCE, GraphRepresentationType.CSR},
+]
+
+def brute_force_components(graph: Graph) -> list[list[Vertex]]:
+    adjacency = [[] for _ in range(graph.get_quantity_of_vertices())]
+    for vertex_a, vertex_b in graph.get_edges():
+        adjacency[vertex_a].append(vertex_b)
+        adjacency[vertex_b].append(vertex_a)
+    visited = [False] * len(adjacency)
+    components = []
+    for root in range(len(adjacency)):
+        if visited[root]:
+            continue
+        visited[root] = True
+        component = [root]
+        for vertex in component:
+            for neighbor in adjacency[vertex]:
+                if not visited[neighbor]:
+                    visited[neighbor] = True
+                    component.append(neighbor)
+        components.append(sorted(component))
+    return components
+
+def check_components(graph: Graph) -> None:
+    expected = brute_force_components(graph)
+    components = graph.get_components()
+    if components != expected:
+        raise AssertionError(f"Componentes {components}, esperado {expected}")
+    sizes = graph.component_sizes()
+    if sorted(sizes.values()) != sorted(len(component) for component in expected):
+        raise AssertionError(f"Tamanhos {sizes}, esperado {[len(component) for component in expected]}")
+    for component in expected:
+        representative = graph.component_of(component[0])
+        if representative not in component or sizes[representative] != len(component):
+            raise AssertionError(f"Representante {representative} inválido para {component}")
+        if any(not graph.same_component(component[0], vertex) for vertex in component):
+            raise AssertionError(f"Vértices de {component} em componentes diferentes")
+
+def run_trial(generator: random.Random, representations: set[GraphRepresentationType] | None) -> None:
+    graph = Graph(generator.randint(1, MAX_VERTICES), representations)
+    for _ in range(generator.randint(0, MAX_OPERATIONS)):
+        operation = generator.random()
+        quantity_of_vertices = graph.get_quantity_of_vertices()
+        if operation < 0.45:
+            graph.create_edge(generator.randrange(quantity_of_vertices), generator.randrange(quantity_of_vertices))
+        elif operation < 0.85:
+            edges = graph.get_edges()
+            if edges:
+                graph.delete_edge(*generator.choice(edges))
+        elif operation < 0.88:
+            graph.add_vertex()
+        elif operation < 0.9:
+            # Descarta uma representação (declarada ou interna) no meio da sequência; ela é remontada quando for usada de novo
+            graph.drop_representation(generator.choice(list(GraphRepresentationType)))
+        else:
+            graph.create_edges([(generator.randrange(quantity_of_vertices), generator.randrange(quantity_of_vertices), 1) for _ in range(3)])
+        if generator.random() < 0.3:
+            check_components(graph)
+    check_components(graph)
+
+def main():
+    generator = random.Random(SEED)
+    for representations in REPRESENTATION_SETS:
+        for _ in range(QUANTITY_OF_TRIALS):
+            run_trial(generator, representations)
+        names = "padrão" if representations is None else ", ".join(sorted(representation.value for representation in representations))
+        print(f"{names:<20} {QUANTITY_OF_TRIALS} sequências ok")
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,25 @@
 import os
 import json
-from collections import defaultdict, Counter
-from models.graph.graph_components.edge import EdgeInfoTypes
-from models.graph.graph_components.vertex import VertexInfoTypes
+import hashlib
 from models.social_graph import SocialGraph
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), '../resources')
+SNAPSHOT_PATH = os.path.join(DATA_DIR, 'social_graph.snapshot')
+
+INTERACTIONS = [
+    # A abre PR e B faz merge -> peso 3
+    ('interactions_pr_merge.json', 3, False),
+    # B aprova/solicita mudanças no PR de A -> peso 2
+    ('interactions_pr_reviews.json', 2, True),
+    # B comenta na Issue/PR de A -> peso 2
+    ('interactions_issue_comments.json', 2, True),
+    ('interactions_pr_comments.json', 2, True),
+    # A menciona B -> peso 1
+    ('interactions_mentions.json', 1, False),
+    # A reage em um comentário de B -> peso 1
+    ('interactions_positive_reactions.json', 1, False),
+    ('interactions_negative_reactions.json', 1, False),
+]
 
 def load_json(filename):
     filepath = os.path.join(DATA_DIR, filename)
@@ -14,73 +28,46 @@ def load_json(filename):
             return json.load(f)
     return []
 
-def build_social_graph():
-    pr_merge = load_json('interactions_pr_merge.json')
-    pr_reviews = load_json('interactions_pr_reviews.json')
-    issue_comments = load_json('interactions_issue_comments.json')
-    pr_comments = load_json('interactions_pr_comments.json')
-    mentions = load_json('interactions_mentions.json')
-    positive_reactions = load_json('interactions_positive_reactions.json')
-    negative_reactions = load_json('interactions_negative_reactions.json')
-
-    edge_weights = defaultdict(int)
-    users = set()
-
-    # A abre PR e B faz merge -> peso 3
-    for interaction in pr_merge:
-        A, B = interaction['A'], interaction['B']
-        if A and B:
-            edge_weights[(A, B)] += 3
-            users.update([A, B])
-
-    # B aprova/solicita mudanças no PR de A -> peso 2
-    for interaction in pr_reviews:
+def add_interactions(g: SocialGraph, filename: str, weight: int, reverse: bool = False):
+    # Cada interação vira uma aresta entre os usuários, criando os vértices conforme os usuários aparecem
+    edges = []
+    for interaction in load_json(filename):
         A, B = interaction['A'], interaction['B']
         if A and B:
-            edge_weights[(B, A)] += 2
-            users.update([A, B])
+            vertex_a, vertex_b = g.get_or_add_vertex(A), g.get_or_add_vertex(B)
+            edges.append((vertex_b, vertex_a, weight) if reverse else (vertex_a, vertex_b, weight))
+    g.create_edges(edges, keep_direction_weights=True)
 
-    # B comenta na Issue/PR de A -> peso 2
-    for interaction in issue_comments + pr_comments:
-        A, B = interaction['A'], interaction['B']
-        if A and B:
-            edge_weights[(B, A)] += 2
-            users.update([A, B])
-
-    # A menciona B -> peso 1
-    for interaction in mentions:
-        A, B = interaction['A'], interaction['B']
-        if A and B:
-            edge_weights[(A, B)] += 1
-            users.update([A, B])
-
-    # A reage em um comentário de B -> peso 1
-    for interaction in positive_reactions + negative_reactions:
-        A, B = interaction['A'], interaction['B']
-        if A and B:
-            edge_weights[(A, B)] += 1  # A reage ao comentário de B
-            users.update([A, B])
-
-    user_list = sorted(users)
-    user_to_vertex = {user: i for i, user in enumerate(user_list)}
-    vertex_to_user = {i: user for i, user in enumerate(user_list)}
-
-    g = SocialGraph(len(users))
-
-    for user, vertex in user_to_vertex.items():
-        g.add_vertex_info(VertexInfoTypes.LABEL, vertex, user)
-
-    for (user_a, user_b), weight in edge_weights.items():
-        vertex_a = user_to_vertex[user_a]
-        vertex_b = user_to_vertex[user_b]
-        g.create_edge(vertex_a, vertex_b)
-        g.add_edge_info(EdgeInfoTypes.WEIGHT, (vertex_a, vertex_b), weight)
+def build_social_graph():
+    # Interações nos dois sentidos entre o mesmo par viram uma única aresta com os pesos somados
+    g = SocialGraph()
+    for filename, weight, reverse in INTERACTIONS:
+        add_interactions(g, filename, weight, reverse)
+    return g
 
+def get_interactions_fingerprint() -> str:
+    # Hash do conteúdo de todos os arquivos de interação; se qualquer um mudar, o snapshot deixa de valer
+    fingerprint = hashlib.sha256()
+    for filename, weight, reverse in INTERACTIONS:
+        filepath = os.path.join(DATA_DIR, filename)
+        fingerprint.update(f"{filename}:{weight}:{reverse}".encode())
+        if os.path.exists(filepath):
+            with open(filepath, 'rb') as f:
+                fingerprint.update(f.read())
+    return fingerprint.hexdigest()
+
+def load_social_graph():
+    # Reaproveita o grafo já construído numa execução anterior enquanto os arquivos de interação não mudarem
+    fingerprint = get_interactions_fingerprint()
+    g = SocialGraph.load_snapshot(SNAPSHOT_PATH, fingerprint)
+    if g is None:
+        g = build_social_graph()
+        g.save_snapshot(SNAPSHOT_PATH, fingerprint)
     return g
 
 def main():
     print("Construindo grafo social...")
-    g = build_social_graph()
+    g = load_social_graph()
 
     print(f"\nGrafo construído com {g.get_quantity_of_vertices()} usuários e {g.get_quantity_of_edges()} arestas.\n")
     
@@ -0,0 +1,83 @@
+from array import array
+from dataclasses import dataclass
+
+from models.graph.graph_components.vertex import Vertex
+
+
+@dataclass
+class ArticulationPointsResult:
+    articulation_points: list[Vertex]
+    fragmentation_scores: list[int]
+
+
+def find_articulation_points(offsets: array, neighbors: array) -> ArticulationPointsResult:
+    # Tarjan/Hopcroft iterativo sobre a adjacência em CSR, O(V + E) numa única busca em profundidade.
+    # Para cada vértice v, os filhos w com low[w] >= disc[v] formam pedaços que se separam quando v sai do grafo;
+    # com o tamanho das subárvores dá para saber o tamanho de cada pedaço (e do "resto" acima de v).
+    # O score de fragmentação conta só componentes com 2 ou mais vértices, como find_communities_simple:
+    # score = (pedaços com tamanho >= 2 depois da remoção) - 1, e 0 para vértices em componentes de um vértice só.
+    quantity_of_vertices = len(offsets) - 1
+    discovery = array('l', [-1]) * quantity_of_vertices
+    low = array('l', [0]) * quantity_of_vertices
+    subtree_size = array('l', [0]) * quantity_of_vertices
+    separated_size = array('l', [0]) * quantity_of_vertices
+    separated_big_pieces = array('l', [0]) * quantity_of_vertices
+    separated_children = array('l', [0]) * quantity_of_vertices
+    fragmentation_scores = [0] * quantity_of_vertices
+    articulation_points = []
+    time = 0
+
+    for root in range(quantity_of_vertices):
+        if discovery[root] != -1:
+            continue
+        discovery[root] = low[root] = time
+        time += 1
+        subtree_size[root] = 1
+        component = [root]
+        stack = [(root, -1, offsets[root])]
+
+        while stack:
+            vertex, parent, index = stack[-1]
+            if index < offsets[vertex + 1]:
+                stack[-1] = (vertex, parent, index + 1)
+                neighbor = neighbors[index]
+                if neighbor == vertex or neighbor == parent:
+                    continue
+                if discovery[neighbor] == -1:
+                    discovery[neighbor] = low[neighbor] = time
+                    time += 1
+                    subtree_size[neighbor] = 1
+                    component.append(neighbor)
+                    stack.append((neighbor, vertex, offsets[neighbor]))
+                elif discovery[neighbor] < low[vertex]:
+                    low[vertex] = discovery[neighbor]
+                continue
+
+            stack.pop()
+            if parent == -1:
+                continue
+            if low[vertex] < low[parent]:
+                low[parent] = low[vertex]
+            subtree_size[parent] += subtree_size[vertex]
+            if low[vertex] >= discovery[parent]:
+                separated_children[parent] += 1
+                separated_size[parent] += subtree_size[vertex]
+                if subtree_size[vertex] >= 2:
+                    separated_big_pieces[parent] += 1
+
+        component_size = subtree_size[root]
+        for vertex in component:
+            if vertex == root:
+                is_articulation_point = separated_children[vertex] >= 2
+                pieces = separated_big_pieces[vertex]
+            else:
+                is_articulation_point = separated_children[vertex] >= 1
+                remaining_size = component_size - 1 - separated_size[vertex]
+                pieces = separated_big_pieces[vertex] + (1 if remaining_size >= 2 else 0)
+            if is_articulation_point:
+                articulation_points.append(vertex)
+            if component_size >= 2:
+                fragmentation_scores[vertex] = pieces - 1
+
+    articulation_points.sort()
+    return ArticulationPointsResult(articulation_points, fragmentation_scores)
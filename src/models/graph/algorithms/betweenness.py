@@ -0,0 +1,108 @@
+import math
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from models.graph.graph_components.vertex import Vertex
+
+
+@dataclass
+class BetweennessResult:
+    scores: array
+    sources: int
+    exact: bool
+    # Com probabilidade >= confidence, todos os scores estão a no máximo error_bound do valor exato (0 no modo exato)
+    error_bound: float
+
+
+# Betweenness (Brandes, sem pesos) sobre a adjacência em CSR. Cada origem s contribui com delta_s(v), a fração dos caminhos
+# mínimos que partem de s e passam por v. No modo exato todas as origens são usadas; no amostrado, k origens sorteadas
+# com random.Random(seed) e a soma é escalada por n/k. Como delta_s(v) <= n - 2, a desigualdade de Hoeffding (com união
+# sobre os n vértices) dá o erro máximo do score normalizado: n/(n-1) * sqrt(ln(2n/(1-confidence)) / (2k)).
+
+
+def _accumulate(offsets: array, neighbors: array, sources: list[Vertex]) -> array:
+    quantity_of_vertices = len(offsets) - 1
+    scores = array('d', [0.0]) * quantity_of_vertices
+    for source in sources:
+        distances = array('l', [-1]) * quantity_of_vertices
+        paths = array('d', [0.0]) * quantity_of_vertices
+        distances[source] = 0
+        paths[source] = 1.0
+        order = [source]
+        for vertex in order:
+            next_distance = distances[vertex] + 1
+            for index in range(offsets[vertex], offsets[vertex + 1]):
+                neighbor = neighbors[index]
+                if distances[neighbor] == -1:
+                    distances[neighbor] = next_distance
+                    order.append(neighbor)
+                if distances[neighbor] == next_distance:
+                    paths[neighbor] += paths[vertex]
+
+        dependencies = array('d', [0.0]) * quantity_of_vertices
+        for vertex in reversed(order):
+            previous_distance = distances[vertex] - 1
+            coefficient = (1.0 + dependencies[vertex]) / paths[vertex]
+            for index in range(offsets[vertex], offsets[vertex + 1]):
+                neighbor = neighbors[index]
+                if distances[neighbor] == previous_distance:
+                    dependencies[neighbor] += paths[neighbor] * coefficient
+            if vertex != source:
+                scores[vertex] += dependencies[vertex]
+    return scores
+
+
+_worker_adjacency: tuple = ()
+
+
+def _init_worker(offsets: array, neighbors: array) -> None:
+    # A adjacência é enviada uma vez para cada processo no initializer e só lida pelos blocos de origens
+    global _worker_adjacency
+    _worker_adjacency = (offsets, neighbors)
+
+
+def _accumulate_in_worker(sources: list[Vertex]) -> array:
+    offsets, neighbors = _worker_adjacency
+    return _accumulate(offsets, neighbors, sources)
+
+
+def get_error_bound(quantity_of_vertices: int, samples: int, confidence: float = 0.95) -> float:
+    # Erro máximo do betweenness normalizado com k origens amostradas, para todos os vértices ao mesmo tempo
+    if samples >= quantity_of_vertices or quantity_of_vertices <= 2:
+        return 0.0
+    if samples <= 0:
+        return math.inf
+    return quantity_of_vertices / (quantity_of_vertices - 1) * math.sqrt(math.log(2 * quantity_of_vertices / (1 - confidence)) / (2 * samples))
+
+
+def betweenness_centrality(offsets: array, neighbors: array, samples: int | None = None, seed: int = 0, normalized: bool = True,
+                           workers: int | None = None, confidence: float = 0.95) -> BetweennessResult:
+    quantity_of_vertices = len(offsets) - 1
+    exact = samples is None or samples >= quantity_of_vertices
+    if exact:
+        sources = list(range(quantity_of_vertices))
+    else:
+        sources = random.Random(seed).sample(range(quantity_of_vertices), samples)
+
+    if workers is not None and workers > 1 and len(sources) > 1:
+        chunk_size = max(1, math.ceil(len(sources) / (workers * 4)))
+        chunks = [sources[start:start + chunk_size] for start in range(0, len(sources), chunk_size)]
+        scores = array('d', [0.0]) * quantity_of_vertices
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(offsets, neighbors)) as executor:
+            for partial_scores in executor.map(_accumulate_in_worker, chunks):
+                for vertex, score in enumerate(partial_scores):
+                    scores[vertex] += score
+    else:
+        scores = _accumulate(offsets, neighbors, sources)
+
+    # Grafo não direcionado: cada par é contado a partir das duas pontas
+    scale = (quantity_of_vertices / len(sources) if sources else 0.0) / 2
+    error_bound = get_error_bound(quantity_of_vertices, len(sources), confidence)
+    if normalized:
+        pairs = (quantity_of_vertices - 1) * (quantity_of_vertices - 2) / 2
+        scale = scale / pairs if pairs > 0 else 0.0
+    elif quantity_of_vertices > 2:
+        error_bound *= (quantity_of_vertices - 1) * (quantity_of_vertices - 2) / 2
+    return BetweennessResult(array('d', [score * scale for score in scores]), len(sources), exact, error_bound)
@@ -0,0 +1,48 @@
+from array import array
+from collections import deque
+
+from models.graph.graph_components.vertex import Vertex
+
+
+class BoundedBFS:
+    # Busca em largura sobre a adjacência em CSR que para assim que passa de max_depth ou junta max_results vértices.
+    # Em vez de um set de visitados por busca, guarda o número da busca em que cada vértice foi visitado;
+    # começar uma nova busca é só incrementar esse número, então o buffer é reaproveitado entre chamadas.
+    def __init__(self):
+        self.__visited_in_search = array('q')
+        self.__search = 0
+
+    def __prepare(self, quantity_of_vertices: int) -> None:
+        missing = quantity_of_vertices - len(self.__visited_in_search)
+        if missing > 0:
+            self.__visited_in_search.extend(array('q', [0]) * missing)
+        self.__search += 1
+
+    def search(self, offsets: array, neighbors: array, source: Vertex, max_depth: int | None = None,
+               max_results: int | None = None, min_depth: int = 1) -> list[tuple[Vertex, int]]:
+        # (vértice, distância) na ordem de descoberta, ou seja, em ordem crescente de distância,
+        # só com os vértices a distância >= min_depth
+        self.__prepare(len(offsets) - 1)
+        visited_in_search, search = self.__visited_in_search, self.__search
+        visited_in_search[source] = search
+        results = []
+        if min_depth <= 0:
+            results.append((source, 0))
+        queue = deque([(source, 0)])
+
+        while queue:
+            if max_results is not None and len(results) >= max_results:
+                break
+            vertex, distance = queue.popleft()
+            if max_depth is not None and distance >= max_depth:
+                break
+            for index in range(offsets[vertex], offsets[vertex + 1]):
+                neighbor = neighbors[index]
+                if visited_in_search[neighbor] == search:
+                    continue
+                visited_in_search[neighbor] = search
+                queue.append((neighbor, distance + 1))
+                if distance + 1 >= min_depth:
+                    results.append((neighbor, distance + 1))
+
+        return results if max_results is None else results[:max_results]
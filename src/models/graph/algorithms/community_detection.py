@@ -0,0 +1,258 @@
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from enum import StrEnum
+
+
+class CommunityDetectionMode(StrEnum):
+    LABEL_PROPAGATION = "label_propagation"
+    LOUVAIN = "louvain"
+
+
+@dataclass
+class CommunityDetectionResult:
+    # communities[v] é a comunidade do vértice v, numeradas de 0 na ordem do menor vértice de cada uma
+    communities: array
+    modularity: float
+
+
+# Detecção de comunidades ponderada sobre a adjacência em CSR com pesos (offsets, vizinhos, pesos).
+# Cada posição do CSR conta o peso uma vez, então uma aresta (u, v) entra duas vezes no total (u -> v e v -> u).
+# A ordem de visita dos vértices é embaralhada com um random.Random(seed), então a mesma semente dá o mesmo resultado.
+
+
+def _renumber(communities: array) -> array:
+    numbers = {}
+    return array('l', [numbers.setdefault(community, len(numbers)) for community in communities])
+
+
+def _get_degrees(offsets: array, weights: array) -> array:
+    return array('d', [sum(weights[offsets[vertex]:offsets[vertex + 1]]) for vertex in range(len(offsets) - 1)])
+
+
+def compute_modularity(offsets: array, neighbors: array, weights: array, communities: array, resolution: float = 1.0) -> float:
+    total_weight = sum(weights)
+    if not total_weight:
+        return 0.0
+    internal_weights: dict[int, float] = {}
+    community_totals: dict[int, float] = {}
+    for vertex in range(len(offsets) - 1):
+        community = communities[vertex]
+        for index in range(offsets[vertex], offsets[vertex + 1]):
+            if communities[neighbors[index]] == community:
+                internal_weights[community] = internal_weights.get(community, 0) + weights[index]
+            community_totals[community] = community_totals.get(community, 0) + weights[index]
+    return sum(
+        internal_weights.get(community, 0) / total_weight - resolution * (community_total / total_weight) ** 2
+        for community, community_total in community_totals.items()
+    )
+
+
+def label_propagation(offsets: array, neighbors: array, weights: array, seed: int = 0, max_iterations: int = 20) -> array:
+    # Propagação de rótulos assíncrona: cada vértice adota o rótulo com maior peso somado entre os vizinhos.
+    # Mantém o rótulo atual quando ele empata com o melhor, senão o menor rótulo entre os empatados; O(E) por iteração
+    quantity_of_vertices = len(offsets) - 1
+    labels = array('l', range(quantity_of_vertices))
+    order = list(range(quantity_of_vertices))
+    generator = random.Random(seed)
+
+    for _ in range(max_iterations):
+        generator.shuffle(order)
+        changed = 0
+        for vertex in order:
+            start, end = offsets[vertex], offsets[vertex + 1]
+            if start == end:
+                continue
+            label_weights: dict[int, float] = {}
+            for index in range(start, end):
+                neighbor = neighbors[index]
+                if neighbor != vertex:
+                    label = labels[neighbor]
+                    label_weights[label] = label_weights.get(label, 0) + weights[index]
+            if not label_weights:
+                continue
+            best_weight = max(label_weights.values())
+            current = labels[vertex]
+            if label_weights.get(current) == best_weight:
+                continue
+            labels[vertex] = min(label for label, weight in label_weights.items() if weight == best_weight)
+            changed += 1
+        if not changed:
+            break
+
+    return _renumber(labels)
+
+
+def _best_community(vertex: int, offsets: array, neighbors: array, weights: array, degrees: array,
+                    communities: array, community_totals: array, total_weight: float, resolution: float) -> int:
+    # Ganho de modularidade (a menos de uma constante) de mover o vértice para cada comunidade vizinha,
+    # considerando o vértice já retirado da sua comunidade atual; só sai dela se o ganho for estritamente maior
+    current = communities[vertex]
+    degree = degrees[vertex]
+    links: dict[int, float] = {}
+    for index in range(offsets[vertex], offsets[vertex + 1]):
+        neighbor = neighbors[index]
+        if neighbor != vertex:
+            community = communities[neighbor]
+            links[community] = links.get(community, 0) + weights[index]
+
+    factor = resolution * degree / total_weight
+    best_community = current
+    best_gain = links.get(current, 0) - factor * (community_totals[current] - degree)
+    for community, link_weight in links.items():
+        if community == current:
+            continue
+        gain = link_weight - factor * community_totals[community]
+        if gain > best_gain or (gain == best_gain and community < best_community and best_community != current):
+            best_community = community
+            best_gain = gain
+    return best_community
+
+
+def _move(vertex: int, community: int, degrees: array, communities: array, community_totals: array) -> None:
+    community_totals[communities[vertex]] -= degrees[vertex]
+    community_totals[community] += degrees[vertex]
+    communities[vertex] = community
+
+
+def _local_move(offsets: array, neighbors: array, weights: array, degrees: array, communities: array, community_totals: array,
+                total_weight: float, resolution: float, generator: random.Random, max_passes: int) -> bool:
+    order = list(range(len(offsets) - 1))
+    improved = False
+    for _ in range(max_passes):
+        generator.shuffle(order)
+        moved = 0
+        for vertex in order:
+            community = _best_community(vertex, offsets, neighbors, weights, degrees, communities, community_totals, total_weight, resolution)
+            if community != communities[vertex]:
+                _move(vertex, community, degrees, communities, community_totals)
+                moved += 1
+        if not moved:
+            break
+        improved = True
+    return improved
+
+
+_worker_graph: tuple = ()
+
+
+def _init_worker(offsets: array, neighbors: array, weights: array, degrees: array, total_weight: float, resolution: float) -> None:
+    # Os arrays do nível atual são enviados uma vez por processo, no initializer, e não a cada bloco
+    global _worker_graph
+    _worker_graph = (offsets, neighbors, weights, degrees, total_weight, resolution)
+
+
+def _propose_moves(vertices: list[int], communities: array, community_totals: array) -> list[tuple[int, int]]:
+    offsets, neighbors, weights, degrees, total_weight, resolution = _worker_graph
+    moves = []
+    for vertex in vertices:
+        community = _best_community(vertex, offsets, neighbors, weights, degrees, communities, community_totals, total_weight, resolution)
+        if community != communities[vertex]:
+            moves.append((vertex, community))
+    return moves
+
+
+def _parallel_local_move(offsets: array, neighbors: array, weights: array, degrees: array, communities: array, community_totals: array,
+                         total_weight: float, resolution: float, generator: random.Random, max_passes: int,
+                         workers: int, chunk_size: int) -> bool:
+    # Cada processo propõe movimentos para um bloco de vértices olhando o mesmo estado do início da passada;
+    # os movimentos são aplicados juntos depois. Para dois vértices sozinhos não trocarem de comunidade entre si
+    # para sempre, um vértice sozinho só entra em outra comunidade unitária de número menor que a sua.
+    # Como as propostas usam um estado desatualizado, a passada só é mantida se a modularidade subir.
+    order = list(range(len(offsets) - 1))
+    improved = False
+    modularity = compute_modularity(offsets, neighbors, weights, communities, resolution)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(offsets, neighbors, weights, degrees, total_weight, resolution)) as executor:
+        for _ in range(max_passes):
+            generator.shuffle(order)
+            chunks = [order[start:start + chunk_size] for start in range(0, len(order), chunk_size)]
+            futures = [executor.submit(_propose_moves, chunk, communities, community_totals) for chunk in chunks]
+            moves = [move for future in futures for move in future.result()]
+
+            previous_communities, previous_totals = array('l', communities), array('d', community_totals)
+            sizes: dict[int, int] = {}
+            for community in communities:
+                sizes[community] = sizes.get(community, 0) + 1
+            moved = 0
+            for vertex, community in moves:
+                current = previous_communities[vertex]
+                if sizes[current] == 1 and sizes.get(community) == 1 and community > current:
+                    continue
+                _move(vertex, community, degrees, communities, community_totals)
+                moved += 1
+
+            new_modularity = compute_modularity(offsets, neighbors, weights, communities, resolution)
+            if not moved or new_modularity <= modularity:
+                communities[:] = previous_communities
+                community_totals[:] = previous_totals
+                break
+            modularity = new_modularity
+            improved = True
+    return improved
+
+
+def _aggregate(offsets: array, neighbors: array, weights: array, communities: array) -> tuple[array, array, array]:
+    # Grafo em que cada comunidade vira um vértice; o peso interno de cada comunidade vira um laço,
+    # então o grau de cada novo vértice é a soma dos graus dos seus membros
+    quantity_of_communities = max(communities) + 1 if len(communities) else 0
+    rows: list[dict[int, float]] = [{} for _ in range(quantity_of_communities)]
+    for vertex in range(len(offsets) - 1):
+        row = rows[communities[vertex]]
+        for index in range(offsets[vertex], offsets[vertex + 1]):
+            community = communities[neighbors[index]]
+            row[community] = row.get(community, 0) + weights[index]
+
+    new_offsets = array('l', [0])
+    new_neighbors = array('l')
+    new_weights = array('d')
+    for row in rows:
+        for community in sorted(row):
+            new_neighbors.append(community)
+            new_weights.append(row[community])
+        new_offsets.append(len(new_neighbors))
+    return new_offsets, new_neighbors, new_weights
+
+
+def louvain(offsets: array, neighbors: array, weights: array, seed: int = 0, resolution: float = 1.0, max_levels: int = 10,
+            max_passes: int = 20, workers: int | None = None, chunk_size: int = 10000) -> array:
+    # Louvain: movimentos locais até nenhum vértice melhorar a modularidade, depois agrega as comunidades
+    # em vértices e repete no grafo menor. Com workers > 1 os movimentos locais rodam em blocos num pool de processos
+    quantity_of_vertices = len(offsets) - 1
+    membership = array('l', range(quantity_of_vertices))
+    total_weight = sum(weights)
+    if not total_weight:
+        return membership
+    generator = random.Random(seed)
+
+    for _ in range(max_levels):
+        level_size = len(offsets) - 1
+        degrees = _get_degrees(offsets, weights)
+        communities = array('l', range(level_size))
+        community_totals = array('d', degrees)
+        if workers is not None and workers > 1:
+            improved = _parallel_local_move(offsets, neighbors, weights, degrees, communities, community_totals,
+                                            total_weight, resolution, generator, max_passes, workers, chunk_size)
+        else:
+            improved = _local_move(offsets, neighbors, weights, degrees, communities, community_totals,
+                                   total_weight, resolution, generator, max_passes)
+        if not improved:
+            break
+        communities = _renumber(communities)
+        membership = array('l', [communities[community] for community in membership])
+        offsets, neighbors, weights = _aggregate(offsets, neighbors, weights, communities)
+
+    return _renumber(membership)
+
+
+def detect_communities(offsets: array, neighbors: array, weights: array,
+                       mode: CommunityDetectionMode = CommunityDetectionMode.LOUVAIN, seed: int = 0, resolution: float = 1.0,
+                       workers: int | None = None, chunk_size: int = 10000) -> CommunityDetectionResult:
+    if mode == CommunityDetectionMode.LABEL_PROPAGATION:
+        communities = label_propagation(offsets, neighbors, weights, seed)
+    elif mode == CommunityDetectionMode.LOUVAIN:
+        communities = louvain(offsets, neighbors, weights, seed, resolution, workers=workers, chunk_size=chunk_size)
+    else:
+        raise ValueError(f"Unknown community detection mode {mode}")
+    return CommunityDetectionResult(communities, compute_modularity(offsets, neighbors, weights, communities, resolution))
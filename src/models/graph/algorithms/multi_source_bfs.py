@@ -0,0 +1,95 @@
+from array import array
+from typing import Iterator, Sequence
+
+from models.graph.graph_components.vertex import Vertex
+
+# Busca em largura de várias origens ao mesmo tempo (MS-BFS) sobre a adjacência em CSR.
+# Cada origem do lote ocupa um bit; seen[v] e a fronteira de cada vértice são inteiros do Python usados como bitsets,
+# então uma única passada pelas arestas de um vértice avança todas as origens do lote que chegaram nele.
+# Como os inteiros do Python não têm tamanho fixo, o lote não fica preso a 64 origens: batch_size pode ser qualquer valor.
+# Dentro de um mesmo nível os vértices são visitados em ordem crescente, então empates de distância saem por id do vértice.
+
+
+def _start_batch(quantity_of_vertices: int, batch: Sequence[Vertex]) -> tuple[list[int], dict[Vertex, int]]:
+    seen = [0] * quantity_of_vertices
+    frontier: dict[Vertex, int] = {}
+    for bit, source in enumerate(batch):
+        seen[source] |= 1 << bit
+        frontier[source] = frontier.get(source, 0) | 1 << bit
+    return seen, frontier
+
+
+def _advance(offsets: array, neighbors: array, frontier: dict[Vertex, int], seen: list[int], active: int) -> dict[Vertex, int]:
+    # Um nível da busca para todas as origens ativas: devolve, por vértice, os bits das origens que o alcançaram agora
+    reached: dict[Vertex, int] = {}
+    for vertex, bits in frontier.items():
+        bits &= active
+        if not bits:
+            continue
+        for index in range(offsets[vertex], offsets[vertex + 1]):
+            neighbor = neighbors[index]
+            reached[neighbor] = reached.get(neighbor, 0) | bits
+
+    next_frontier = {}
+    for vertex in sorted(reached):
+        new_bits = reached[vertex] & ~seen[vertex]
+        if new_bits:
+            seen[vertex] |= new_bits
+            next_frontier[vertex] = new_bits
+    return next_frontier
+
+
+def _iter_bits(bits: int) -> Iterator[int]:
+    while bits:
+        lowest_bit = bits & -bits
+        yield lowest_bit.bit_length() - 1
+        bits ^= lowest_bit
+
+
+def iter_multi_source_distances(offsets: array, neighbors: array, sources: Sequence[Vertex], max_depth: int | None = None,
+                                batch_size: int = 256) -> Iterator[tuple[Vertex, array]]:
+    # (origem, distâncias) para cada origem, na ordem de sources; -1 para vértices não alcançados (ou além de max_depth).
+    # Gera um lote por vez, então só batch_size vetores de distância ficam em memória ao mesmo tempo
+    quantity_of_vertices = len(offsets) - 1
+    for start in range(0, len(sources), batch_size):
+        batch = sources[start:start + batch_size]
+        distances = [array('l', [-1]) * quantity_of_vertices for _ in batch]
+        for bit, source in enumerate(batch):
+            distances[bit][source] = 0
+        seen, frontier = _start_batch(quantity_of_vertices, batch)
+        active = (1 << len(batch)) - 1
+        depth = 0
+        while frontier and (max_depth is None or depth < max_depth):
+            depth += 1
+            frontier = _advance(offsets, neighbors, frontier, seen, active)
+            for vertex, new_bits in frontier.items():
+                for bit in _iter_bits(new_bits):
+                    distances[bit][vertex] = depth
+        yield from zip(batch, distances)
+
+
+def multi_source_closest(offsets: array, neighbors: array, sources: Sequence[Vertex], top_n: int, min_depth: int = 2,
+                         batch_size: int = 256) -> list[list[tuple[Vertex, int]]]:
+    # Para cada origem, os top_n vértices mais próximos a distância >= min_depth (com min_depth=2, os não vizinhos).
+    # Uma origem sai do lote assim que junta top_n resultados, e o lote termina quando todas saírem
+    quantity_of_vertices = len(offsets) - 1
+    results: list[list[tuple[Vertex, int]]] = []
+    for start in range(0, len(sources), batch_size):
+        batch = sources[start:start + batch_size]
+        batch_results: list[list[tuple[Vertex, int]]] = [[] for _ in batch]
+        seen, frontier = _start_batch(quantity_of_vertices, batch)
+        active = (1 << len(batch)) - 1 if top_n > 0 else 0
+        depth = 0
+        while frontier and active:
+            depth += 1
+            frontier = _advance(offsets, neighbors, frontier, seen, active)
+            if depth < min_depth:
+                continue
+            for vertex, new_bits in frontier.items():
+                for bit in _iter_bits(new_bits & active):
+                    source_results = batch_results[bit]
+                    source_results.append((vertex, depth))
+                    if len(source_results) >= top_n:
+                        active &= ~(1 << bit)
+        results.extend(batch_results)
+    return results
@@ -0,0 +1,98 @@
+import heapq
+import math
+from array import array
+from enum import StrEnum
+from typing import Callable, Iterable
+
+from models.graph.graph_components.vertex import Vertex
+
+
+class WeightTransform(StrEnum):
+    # Como o peso de uma aresta (força da interação) vira distância: quanto mais interação, mais perto
+    INVERSE = "inverse"
+    UNIT = "unit"
+    WEIGHT = "weight"
+
+
+def transform_weights(weights: array, transform: WeightTransform | Callable[[float], float] = WeightTransform.INVERSE) -> array:
+    # Arestas sem peso positivo ficam com distância infinita no INVERSE, ou seja, não são usadas nos caminhos
+    if transform == WeightTransform.INVERSE:
+        return array('d', [1 / weight if weight > 0 else math.inf for weight in weights])
+    if transform == WeightTransform.UNIT:
+        return array('d', [1.0]) * len(weights)
+    if transform == WeightTransform.WEIGHT:
+        return array('d', weights)
+    if callable(transform):
+        return array('d', [transform(weight) for weight in weights])
+    raise ValueError(f"Unknown weight transform {transform}")
+
+
+class DijkstraEngine:
+    # Dijkstra com heap binária sobre a adjacência em CSR com distâncias (offsets, vizinhos, distâncias).
+    # Como na BoundedBFS, os buffers de distância são reaproveitados entre buscas: cada vértice guarda o número da
+    # busca em que sua distância foi escrita, então não há nada para limpar entre uma consulta e outra.
+    def __init__(self):
+        self.__distances = array('d')
+        self.__reached_in_search = array('q')
+        self.__settled_in_search = array('q')
+        self.__search = 0
+
+    def __prepare(self, quantity_of_vertices: int) -> None:
+        missing = quantity_of_vertices - len(self.__distances)
+        if missing > 0:
+            self.__distances.extend(array('d', [0]) * missing)
+            self.__reached_in_search.extend(array('q', [0]) * missing)
+            self.__settled_in_search.extend(array('q', [0]) * missing)
+        self.__search += 1
+
+    def search(self, offsets: array, neighbors: array, edge_distances: array, source: Vertex, max_results: int | None = None,
+               targets: Iterable[Vertex] | None = None, max_distance: float = math.inf) -> list[tuple[Vertex, float]]:
+        # (vértice, distância) na ordem em que são fixados, ou seja, em ordem crescente de distância, sem a origem.
+        # Para depois de fixar max_results vértices (contando só os de targets, se houver) ou quando todos os targets
+        # forem fixados; com targets, só eles aparecem no resultado
+        self.__prepare(len(offsets) - 1)
+        distances, reached_in_search, settled_in_search = self.__distances, self.__reached_in_search, self.__settled_in_search
+        search = self.__search
+        remaining_targets = set(targets) if targets is not None else None
+        if remaining_targets is not None:
+            remaining_targets.discard(source)
+            if not remaining_targets:
+                return []
+
+        distances[source] = 0.0
+        reached_in_search[source] = search
+        heap = [(0.0, source)]
+        results = []
+
+        while heap:
+            distance, vertex = heapq.heappop(heap)
+            if settled_in_search[vertex] == search:
+                continue
+            if distance > max_distance:
+                break
+            settled_in_search[vertex] = search
+            if vertex != source:
+                if remaining_targets is None:
+                    results.append((vertex, distance))
+                elif vertex in remaining_targets:
+                    results.append((vertex, distance))
+                    remaining_targets.discard(vertex)
+                    if not remaining_targets:
+                        break
+                if max_results is not None and len(results) >= max_results:
+                    break
+
+            for index in range(offsets[vertex], offsets[vertex + 1]):
+                neighbor = neighbors[index]
+                if settled_in_search[neighbor] == search:
+                    continue
+                new_distance = distance + edge_distances[index]
+                # Arestas com distância infinita não levam a lugar nenhum: o vizinho só é alcançado por outro caminho
+                if new_distance == math.inf:
+                    continue
+                if reached_in_search[neighbor] != search or new_distance < distances[neighbor]:
+                    distances[neighbor] = new_distance
+                    reached_in_search[neighbor] = search
+                    heapq.heappush(heap, (new_distance, neighbor))
+
+        return results
@@ -0,0 +1,52 @@
+import heapq
+from array import array
+from dataclasses import dataclass
+from typing import Any, Iterator, Sequence
+
+from models.graph.graph_components.vertex import Vertex
+
+
+@dataclass
+class TopNeighborsResult:
+    # Resultado em colunas, no mesmo formato do CSR: os vizinhos da origem sources[i] ficam em
+    # neighbors[offsets[i]:offsets[i + 1]], do maior peso para o menor, com o peso na mesma posição de weights
+    sources: array
+    offsets: array
+    neighbors: array
+    weights: array
+
+    def get(self, index: int) -> list[tuple[Vertex, Any]]:
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return list(zip(self.neighbors[start:end], self.weights[start:end]))
+
+    def iter_rows(self, labels: Sequence[Any] | None = None) -> Iterator[tuple[Any, int, Any, Any]]:
+        # Linhas (origem, posição, vizinho, peso) prontas para exportar; com labels, os vértices viram rótulos
+        for index, source in enumerate(self.sources):
+            for rank, position in enumerate(range(self.offsets[index], self.offsets[index + 1]), 1):
+                neighbor = self.neighbors[position]
+                if labels is not None:
+                    yield labels[source], rank, labels[neighbor], self.weights[position]
+                else:
+                    yield source, rank, neighbor, self.weights[position]
+
+
+def top_weighted_neighbors(offsets: array, neighbors: array, weights: array, top_n: int,
+                           sources: Sequence[Vertex] | None = None) -> TopNeighborsResult:
+    # Os top_n vizinhos de maior peso de cada origem (todas, se sources for None) numa única passada pelas linhas do CSR,
+    # O(E log k). Empates de peso saem pelo menor id de vizinho; laços (v, v) são ignorados
+    if sources is None:
+        sources = range(len(offsets) - 1)
+    result_sources = array('l', sources)
+    result_offsets = array('l', [0])
+    result_neighbors = array('l')
+    result_weights = array(weights.typecode) if isinstance(weights, array) else array('d')
+
+    for source in result_sources:
+        start, end = offsets[source], offsets[source + 1]
+        row = [index for index in range(start, end) if neighbors[index] != source]
+        for index in heapq.nlargest(top_n, row, key=weights.__getitem__):
+            result_neighbors.append(neighbors[index])
+            result_weights.append(weights[index])
+        result_offsets.append(len(result_neighbors))
+
+    return TopNeighborsResult(result_sources, result_offsets, result_neighbors, result_weights)
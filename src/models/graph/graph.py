@@ -1,110 +1,418 @@
-from typing import Any
+import sys
+from array import array
+from typing import Any, Iterable, Mapping, Sequence
 
-from models.graph.graph_components.edge import Edge, EdgeInfoTypes
+from models.graph.graph_components.edge import Edge, EdgeInfoTypes, normalize_edge
+from models.graph.graph_components.attribute_store import AttributeColumn, AttributeStore, as_python_number
+from models.graph.graph_components.component_index import ComponentIndex
+from models.graph.graph_components.degree_index import DegreeIndex
+from models.graph.graph_components.edge_store import EdgeStore
 from models.graph.graph_components.vertex import Vertex, VertexInfoTypes
 from models.graph.graph_representations.adjacency.adjacency_matrix_representation import AdjacencyMatrixRepresentation
 from models.graph.graph_representations.adjacency.adjacenty_list_representation import AdjacencyListRepresentation
+from models.graph.graph_representations.adjacency.csr_representation import CSRRepresentation
 from models.graph.graph_representations.graph_representation import GraphRepresentation
 from models.graph.graph_representations.graph_representations_types import GraphRepresentationType
 from models.graph.graph_representations.incidence.incidence_representation import IncidenceRepresentation
+from models.graph.graph_view import GraphView
+from models.graph.graph_snapshot import GraphSnapshot, read_graph_snapshot, write_graph_snapshot
 
 class Graph:
-    def __init__(self, quantity_of_vertices: int, representations: set[GraphRepresentationType] = None):
+    def __init__(self, quantity_of_vertices: int = 0, representations: set[GraphRepresentationType] = None):
         self.quantity_of_vertices = quantity_of_vertices
         self.__graph_representations: dict[GraphRepresentationType, GraphRepresentation] = {}
+        # Representações montadas só para uso interno (CSR dos algoritmos, por exemplo) quando não foram declaradas;
+        # não respondem às consultas públicas, mas são mantidas atualizadas como as outras
+        self.__internal_representations: dict[GraphRepresentationType, GraphRepresentation] = {}
+        self.__enabled_representations: set[GraphRepresentationType] = set(representations) if representations else {
+            GraphRepresentationType.ADJACENCY_MATRIX, GraphRepresentationType.ADJACENCY_LIST, GraphRepresentationType.INCIDENCE, GraphRepresentationType.CSR
+        }
+        self.__edges = EdgeStore()
+        self.__degrees = DegreeIndex(quantity_of_vertices)
+        self.__components = ComponentIndex(quantity_of_vertices)
+        # Incrementada a cada mudança no grafo (vértices, arestas ou atributos); caches comparam com ela para saber se ainda valem
+        self.__version = 0
+        # CSR com pesos já montado, por valor padrão de peso, válido enquanto a versão não mudar
+        self.__weighted_adjacency: dict[Any, tuple[array, array, array]] = {}
+        self.__weighted_adjacency_version = 0
 
-        self.__vertexes_info: dict[Vertex, dict[VertexInfoTypes, Any]] = {}
-        self.__edges_info: dict[Edge, dict[EdgeInfoTypes, Any]] = {}
-        
-        self.__fill_graph_representations(representations)
+        self.__vertexes_info = AttributeStore()
+        self.__edges_info = AttributeStore()
+        self.__vertex_by_label: dict[Any, Vertex] = {}
 
-    def __fill_graph_representations(self, representations: set[GraphRepresentationType] = None):
-        if not representations:
-            representations = {GraphRepresentationType.ADJACENCY_MATRIX, GraphRepresentationType.ADJACENCY_LIST, GraphRepresentationType.INCIDENCE}
-        if GraphRepresentationType.INCIDENCE not in representations:
-            representations.add(GraphRepresentationType.INCIDENCE)
+    def __build_representation(self, representation: GraphRepresentationType) -> GraphRepresentation:
+        # As representações só são montadas quando alguma consulta precisa delas, a partir das arestas já guardadas
+        if representation == GraphRepresentationType.ADJACENCY_MATRIX:
+            graph_representation = AdjacencyMatrixRepresentation(self.quantity_of_vertices)
+        elif representation == GraphRepresentationType.ADJACENCY_LIST:
+            graph_representation = AdjacencyListRepresentation(self.quantity_of_vertices)
+        elif representation == GraphRepresentationType.INCIDENCE:
+            graph_representation = IncidenceRepresentation(self.quantity_of_vertices)
+        elif representation == GraphRepresentationType.CSR:
+            return CSRRepresentation(self.quantity_of_vertices, self.__edges)
+        else:
+            raise ValueError(f"Unknown graph representation: {representation}")
+        for vertex_a, vertex_b in self.__edges:
+            graph_representation.create_edge(vertex_a, vertex_b)
+        return graph_representation
+
+    def prepare_representations(self, representations: set[GraphRepresentationType] = None):
+        if representations is None:
+            representations = self.__enabled_representations
         for representation in representations:
-            if representation == GraphRepresentationType.ADJACENCY_MATRIX:
-                self.__graph_representations[representation] = AdjacencyMatrixRepresentation(self.quantity_of_vertices)
-            elif representation == GraphRepresentationType.ADJACENCY_LIST:
-                self.__graph_representations[representation] = AdjacencyListRepresentation(self.quantity_of_vertices)
-            elif representation == GraphRepresentationType.INCIDENCE:
-                self.__graph_representations[representation] = IncidenceRepresentation(self.quantity_of_vertices)
+            self.__enabled_representations.add(representation)
+            if representation not in self.__graph_representations:
+                self.__graph_representations[representation] = self.__take_or_build_representation(representation)
+
+    def __take_or_build_representation(self, representation: GraphRepresentationType) -> GraphRepresentation:
+        # Uma representação interna já montada é reaproveitada quando passa a ser declarada
+        internal_representation = self.__internal_representations.pop(representation, None)
+        return internal_representation if internal_representation is not None else self.__build_representation(representation)
+
+    def __get_internal_representation(self, representation: GraphRepresentationType) -> GraphRepresentation:
+        # Para os algoritmos: usa a representação declarada se houver, senão monta uma interna a partir das arestas guardadas
+        if representation in self.__graph_representations or representation in self.__enabled_representations:
+            return self.__get_first_disponible_representation([representation])
+        if representation not in self.__internal_representations:
+            self.__internal_representations[representation] = self.__build_representation(representation)
+        return self.__internal_representations[representation]
+
+    def __get_built_representations(self) -> list[GraphRepresentation]:
+        return [*self.__graph_representations.values(), *self.__internal_representations.values()]
+
+    def drop_representation(self, representation: GraphRepresentationType):
+        # Libera também a cópia interna (como o CSR montado para os algoritmos); ela volta a ser montada se for usada de novo
+        self.__graph_representations.pop(representation, None)
+        self.__internal_representations.pop(representation, None)
+
+    def get_materialized_representations(self) -> set[GraphRepresentationType]:
+        return set(self.__graph_representations)
+
+    def add_vertex(self, label: Any = None) -> Vertex:
+        vertex = self.quantity_of_vertices
+        self.quantity_of_vertices += 1
+        self.__degrees.add_vertex()
+        self.__components.add_vertex()
+        self.__version += 1
+        for representation in self.__get_built_representations():
+            representation.add_vertex()
+        if label is not None:
+            self.add_vertex_info(VertexInfoTypes.LABEL, vertex, label)
+        return vertex
+
+    def get_or_add_vertex(self, label: Any) -> Vertex:
+        # Permite montar o grafo direto a partir dos rótulos, criando o vértice na primeira vez que o rótulo aparece
+        vertex = self.__vertex_by_label.get(label)
+        if vertex is None:
+            vertex = self.add_vertex(label)
+        return vertex
+
+    def get_vertex_by_label(self, label: Any) -> Vertex | None:
+        return self.__vertex_by_label.get(label)
+
+    def vertices_for_labels(self, labels: Iterable[Any]) -> list[Vertex | None]:
+        vertex_by_label = self.__vertex_by_label
+        return [vertex_by_label.get(label) for label in labels]
 
+    def labels_for_vertices(self, vertices: Iterable[Vertex]) -> list[Any]:
+        label_column = self.__vertexes_info.get_column(VertexInfoTypes.LABEL)
+        if label_column is None:
+            return [None for _ in vertices]
+        return [label_column.get(vertex) for vertex in vertices]
 
     def create_edge(self, vertex_a: Vertex, vertex_b: Vertex):
-        for representation in self.__graph_representations.values():
+        if not self.__edges.add(vertex_a, vertex_b):
+            return
+        self.__degrees.add_edge(vertex_a, vertex_b)
+        self.__components.union(vertex_a, vertex_b)
+        self.__version += 1
+        for representation in self.__get_built_representations():
             representation.create_edge(vertex_a, vertex_b)
 
+    def create_edges(self, edges: Iterable[Sequence[Any]], keep_direction_weights: bool = False) -> int:
+        # Recebe (u, v), (u, v, peso) ou (u, v, peso, rótulo); pares repetidos nos dois sentidos viram uma aresta só,
+        # com os pesos somados (inclusive ao peso que a aresta já tinha no grafo). Com keep_direction_weights,
+        # a soma de cada sentido também fica guardada em FORWARD_WEIGHT/BACKWARD_WEIGHT
+        merged_weights: dict[Edge, Any] = {}
+        direction_weights: dict[tuple[EdgeInfoTypes, Edge], Any] = {}
+        labels: dict[Edge, Any] = {}
+        for edge in edges:
+            vertex_a, vertex_b = int(edge[0]), int(edge[1])
+            normalized_edge = normalize_edge(vertex_a, vertex_b)
+            if normalized_edge not in merged_weights:
+                merged_weights[normalized_edge] = None
+            if len(edge) > 2 and edge[2] is not None:
+                # Pesos vindos de linhas de um array do numpy viram números do Python, como os ids dos vértices
+                weight = as_python_number(edge[2])
+                current_weight = merged_weights[normalized_edge]
+                merged_weights[normalized_edge] = weight if current_weight is None else current_weight + weight
+                if keep_direction_weights:
+                    direction = EdgeInfoTypes.FORWARD_WEIGHT if vertex_a <= vertex_b else EdgeInfoTypes.BACKWARD_WEIGHT
+                    direction_weights[(direction, normalized_edge)] = direction_weights.get((direction, normalized_edge), 0) + weight
+            if len(edge) > 3:
+                labels[normalized_edge] = edge[3]
+
+        new_edges = [edge for edge in merged_weights if self.__edges.add(edge[0], edge[1])]
+        for vertex_a, vertex_b in new_edges:
+            self.__degrees.add_edge(vertex_a, vertex_b)
+            self.__components.union(vertex_a, vertex_b)
+        if new_edges:
+            self.__version += 1
+        for representation in self.__get_built_representations():
+            representation.create_edges(new_edges)
+
+        for edge, weight in merged_weights.items():
+            if weight is None:
+                continue
+            current_weight = self.get_edge_info(EdgeInfoTypes.WEIGHT, edge)
+            self.add_edge_info(EdgeInfoTypes.WEIGHT, edge, weight if current_weight is None else current_weight + weight)
+        for (direction, edge), weight in direction_weights.items():
+            current_weight = self.get_edge_info(direction, edge)
+            self.add_edge_info(direction, edge, weight if current_weight is None else current_weight + weight)
+        for edge, label in labels.items():
+            self.add_edge_info(EdgeInfoTypes.LABEL, edge, label)
+        return len(new_edges)
+
+    @classmethod
+    def from_edge_list(cls, quantity_of_vertices: int, edges: Iterable[Sequence[Any]], vertex_labels: Sequence[str] | None = None,
+                       representations: set[GraphRepresentationType] = None) -> "Graph":
+        graph = cls(quantity_of_vertices, representations)
+        if vertex_labels is not None:
+            for vertex, label in enumerate(vertex_labels):
+                graph.add_vertex_info(VertexInfoTypes.LABEL, vertex, label)
+        graph.create_edges(edges)
+        return graph
+
+    def save_snapshot(self, path: str, fingerprint: str = "") -> None:
+        # Os ids das arestas são compactados na ordem de get_edges, junto com as colunas de atributos
+        edge_sources, edge_targets = self.__edges.get_edge_arrays()
+        edge_columns = {}
+        for info_type, column in self.__edges_info.get_columns().items():
+            dense_column = AttributeColumn()
+            for index, edge_id in enumerate(self.__edges.get_ids()):
+                value = column.get(edge_id)
+                if value is not None:
+                    dense_column.set(index, value)
+            edge_columns[info_type] = dense_column
+        snapshot = GraphSnapshot(self.quantity_of_vertices, edge_sources, edge_targets, self.__vertexes_info.get_columns(), edge_columns)
+        write_graph_snapshot(path, fingerprint, snapshot)
+
+    @classmethod
+    def load_snapshot(cls, path: str, fingerprint: str = "", representations: set[GraphRepresentationType] = None) -> "Graph | None":
+        snapshot = read_graph_snapshot(path, fingerprint)
+        if snapshot is None:
+            return None
+        graph = cls(snapshot.quantity_of_vertices, representations)
+        graph.__edges = EdgeStore.from_arrays(snapshot.edge_sources, snapshot.edge_targets)
+        for vertex_a, vertex_b in graph.__edges:
+            graph.__degrees.add_edge(vertex_a, vertex_b)
+            graph.__components.union(vertex_a, vertex_b)
+        for name, column in snapshot.vertex_columns.items():
+            graph.__vertexes_info.set_column(cls.__parse_info_type(VertexInfoTypes, name), column)
+        for name, column in snapshot.edge_columns.items():
+            graph.__edges_info.set_column(cls.__parse_info_type(EdgeInfoTypes, name), column)
+        for vertex_a, vertex_b in graph.__edges:
+            weight = graph.__edges_info.get(EdgeInfoTypes.WEIGHT, graph.__edges.get_id((vertex_a, vertex_b)))
+            graph.__degrees.update_weight(vertex_a, vertex_b, None, weight)
+
+        label_column = graph.__vertexes_info.get_column(VertexInfoTypes.LABEL)
+        if label_column is not None:
+            labels = label_column.get_values()
+            graph.__vertex_by_label = {labels[vertex]: vertex for vertex in range(len(labels)) if label_column.get(vertex) is not None}
+        return graph
+
+    @staticmethod
+    def __parse_info_type(info_types: type, name: str) -> Any:
+        try:
+            return info_types(name)
+        except ValueError:
+            return name
+
     def delete_edge(self, vertex_a: Vertex, vertex_b: Vertex):
-        for representation in self.__graph_representations.values():
+        edge_id = self.__edges.remove(vertex_a, vertex_b)
+        if edge_id is None:
+            return
+        # Os componentes são atualizados primeiro. A busca usa a lista de adjacência se ela já estiver montada; senão usa o CSR
+        # (declarado ou interno, só arrays), lendo as linhas junto com as mudanças pendentes para não remontá-lo a cada remoção
+        if GraphRepresentationType.ADJACENCY_LIST in self.__graph_representations:
+            adjacency_list = self.__graph_representations[GraphRepresentationType.ADJACENCY_LIST]
+            adjacency_list.delete_edge(vertex_a, vertex_b)
+            get_neighbors = adjacency_list.get_neighbors
+        else:
+            csr = self.__get_internal_representation(GraphRepresentationType.CSR)
+            csr.delete_edge(vertex_a, vertex_b)
+            get_neighbors = csr.iter_current_neighbors
+        self.__components.remove_edge(vertex_a, vertex_b, get_neighbors)
+        self.__degrees.remove_edge(vertex_a, vertex_b, self.__edges_info.get(EdgeInfoTypes.WEIGHT, edge_id))
+        self.__edges_info.delete(edge_id)
+        self.__version += 1
+        for representation in self.__get_built_representations():
             representation.delete_edge(vertex_a, vertex_b)
 
     def add_vertex_info(self, info_type: VertexInfoTypes, vertex: Vertex, value: Any):
-        if vertex not in self.__vertexes_info:
-            self.__vertexes_info[vertex] = {}
         if info_type == VertexInfoTypes.LABEL and value is None:
             raise ValueError("Label value cannot be None")
-        self.__vertexes_info[vertex][info_type] = value
+        if info_type == VertexInfoTypes.LABEL:
+            # Rótulos internados: o índice e a coluna de atributos compartilham o mesmo objeto de string
+            if isinstance(value, str):
+                value = sys.intern(value)
+            previous_label = self.__vertexes_info.get(VertexInfoTypes.LABEL, vertex)
+            if previous_label is not None and self.__vertex_by_label.get(previous_label) == vertex:
+                del self.__vertex_by_label[previous_label]
+            self.__vertex_by_label[value] = vertex
+        self.__vertexes_info.set(info_type, vertex, value)
+        self.__version += 1
     
     def add_edge_info(self, info_type: EdgeInfoTypes, edge: Edge, value: Any):
-        if edge not in self.__edges_info:
-            self.__edges_info[edge] = {}
         if info_type == EdgeInfoTypes.LABEL and value is None:
             raise ValueError("Label value cannot be None")
-        self.__edges_info[edge][info_type] = value
+        value = as_python_number(value)
+        edge_id = self.__edges.get_id(edge)
+        if edge_id is None:
+            raise ValueError(f"Edge {edge} does not exist")
+        if info_type == EdgeInfoTypes.WEIGHT:
+            self.__degrees.update_weight(edge[0], edge[1], self.__edges_info.get(EdgeInfoTypes.WEIGHT, edge_id), value)
+        self.__edges_info.set(info_type, edge_id, value)
+        self.__version += 1
+
+    def get_version(self) -> int:
+        return self.__version
     
     def get_vertex_info(self, info: VertexInfoTypes, vertex: Vertex) ->  Any:
-        return self.__vertexes_info.get(vertex, {}).get(info)
+        return self.__vertexes_info.get(info, vertex)
 
     def get_edge_info(self, info: EdgeInfoTypes, edge: Edge) -> Any:
-        return self.__edges_info.get(edge, {}).get(info)
+        edge_id = self.__edges.get_id(edge)
+        if edge_id is None:
+            return None
+        return self.__edges_info.get(info, edge_id)
+
+    def get_all_edge_info(self, edge: Edge) -> dict[EdgeInfoTypes, Any]:
+        edge_id = self.__edges.get_id(edge)
+        if edge_id is None:
+            return {}
+        return self.__edges_info.get_all(edge_id)
+
+    def get_edges(self) -> list[Edge]:
+        return list(self.__edges)
+
+    def get_edge_weights(self, default: int = 0) -> array | list:
+        # Pesos na mesma ordem de get_edges, num array tipado para os algoritmos percorrerem em bloco
+        column = self.__edges_info.get_column(EdgeInfoTypes.WEIGHT)
+        if column is None:
+            return array('q', [default]) * len(self.__edges)
+        weights = [column.get(edge_id) for edge_id in self.__edges.get_ids()]
+        weights = [default if weight is None else weight for weight in weights]
+        typecode = column.get_typecode()
+        return array(typecode, weights) if typecode is not None else weights
 
     def __get_first_disponible_representation(self, representations: list[GraphRepresentationType]) -> GraphRepresentation:
         for representation in representations:
             if representation in self.__graph_representations:
                 return self.__graph_representations[representation]
+        for representation in representations:
+            if representation in self.__enabled_representations:
+                self.__graph_representations[representation] = self.__take_or_build_representation(representation)
+                return self.__graph_representations[representation]
         raise ValueError("No valid graph representation found.")
 
     def is_vertexes_adjacent(self, vertex_a: Vertex, vertex_b: Vertex) -> bool:
-        representation_priority = [GraphRepresentationType.ADJACENCY_LIST, GraphRepresentationType.ADJACENCY_MATRIX, GraphRepresentationType.INCIDENCE]
+        representation_priority = [GraphRepresentationType.ADJACENCY_LIST, GraphRepresentationType.CSR, GraphRepresentationType.ADJACENCY_MATRIX, GraphRepresentationType.INCIDENCE]
         representation = self.__get_first_disponible_representation(representation_priority)
         return representation.is_adjacent_vertex(vertex_a, vertex_b)
 
     def is_edges_adjacent(self, edge_a: Edge, edge_b: Edge) -> bool:
-        representation_priority = [GraphRepresentationType.INCIDENCE, GraphRepresentationType.ADJACENCY_LIST, GraphRepresentationType.ADJACENCY_MATRIX]
+        representation_priority = [GraphRepresentationType.INCIDENCE, GraphRepresentationType.ADJACENCY_LIST, GraphRepresentationType.CSR, GraphRepresentationType.ADJACENCY_MATRIX]
         representation = self.__get_first_disponible_representation(representation_priority)
         return representation.is_adjacent_edges(edge_a, edge_b)
 
     def is_edge_incidencing_in_vertex(self, edge: Edge, vertex: Vertex) -> bool:
-        representation_priority = [GraphRepresentationType.INCIDENCE, GraphRepresentationType.ADJACENCY_LIST, GraphRepresentationType.ADJACENCY_MATRIX]
+        representation_priority = [GraphRepresentationType.INCIDENCE, GraphRepresentationType.ADJACENCY_LIST, GraphRepresentationType.CSR, GraphRepresentationType.ADJACENCY_MATRIX]
         representation = self.__get_first_disponible_representation(representation_priority)
         return representation.is_edge_incidencing_in_vertex(edge, vertex)
     
     def edge_exists(self, edge: Edge) -> bool:
-        representation_priority = [GraphRepresentationType.INCIDENCE, GraphRepresentationType.ADJACENCY_LIST, GraphRepresentationType.ADJACENCY_MATRIX]
+        representation_priority = [GraphRepresentationType.INCIDENCE, GraphRepresentationType.ADJACENCY_LIST, GraphRepresentationType.CSR, GraphRepresentationType.ADJACENCY_MATRIX]
         representation = self.__get_first_disponible_representation(representation_priority)
         return representation.edge_exists(edge)
     
     def get_quantity_of_edges(self) -> int:
-        representation_priority = [GraphRepresentationType.INCIDENCE, GraphRepresentationType.ADJACENCY_LIST, GraphRepresentationType.ADJACENCY_MATRIX]
-        representation = self.__get_first_disponible_representation(representation_priority)
-        return representation.get_quantity_of_edges()
+        return len(self.__edges)
     
+    def get_neighbors(self, vertex: Vertex) -> list[Vertex]:
+        # Como em get_adjacency_arrays, o CSR (declarado ou interno) sempre pode ser montado, qualquer que seja a declaração
+        return list(self.__get_internal_representation(GraphRepresentationType.CSR).get_neighbors(vertex))
+
+    def get_degree(self, vertex: Vertex) -> int:
+        return self.__degrees.get_degree(vertex)
+
+    def get_weighted_degree(self, vertex: Vertex) -> int | float:
+        return self.__degrees.get_weighted_degree(vertex)
+
+    def get_degrees(self) -> array:
+        return self.__degrees.get_degrees()
+
+    def get_weighted_degrees(self) -> array:
+        return self.__degrees.get_weighted_degrees()
+
+    def component_of(self, vertex: Vertex) -> Vertex:
+        # Representante do componente do vértice; dois vértices estão no mesmo componente se tiverem o mesmo representante
+        return self.__components.find(vertex)
+
+    def same_component(self, vertex_a: Vertex, vertex_b: Vertex) -> bool:
+        components = self.__components
+        return components.find(vertex_a) == components.find(vertex_b)
+
+    def component_sizes(self) -> dict[Vertex, int]:
+        return self.__components.get_sizes()
+
+    def get_components(self) -> list[list[Vertex]]:
+        # Componentes na ordem do menor vértice de cada um, com os vértices em ordem crescente
+        return self.__components.get_components()
+
+    def get_adjacency_arrays(self) -> tuple[array, array]:
+        # Adjacência em CSR (offsets, vizinhos) para os algoritmos que percorrem o grafo inteiro
+        return self.__get_internal_representation(GraphRepresentationType.CSR).get_csr_arrays()
+
+    def get_weighted_adjacency_arrays(self, default: int = 0) -> tuple[array, array, array]:
+        # CSR com um terceiro array alinhado aos vizinhos: o peso da aresta de cada posição (offsets, vizinhos, pesos)
+        # Os arrays devolvidos são compartilhados entre chamadas até a próxima mudança no grafo e não devem ser alterados
+        if self.__weighted_adjacency_version != self.__version:
+            self.__weighted_adjacency = {}
+            self.__weighted_adjacency_version = self.__version
+        if default in self.__weighted_adjacency:
+            return self.__weighted_adjacency[default]
+        offsets, neighbors = self.get_adjacency_arrays()
+        column = self.__edges_info.get_column(EdgeInfoTypes.WEIGHT)
+        # Pesos inteiros continuam inteiros (array('q')); qualquer outra coluna vira array('d')
+        typecode = 'q' if (column is None or column.get_typecode() == 'q') and isinstance(default, int) else 'd'
+        weights = array(typecode, [default]) * len(neighbors)
+        if column is not None:
+            for vertex in range(self.quantity_of_vertices):
+                for index in range(offsets[vertex], offsets[vertex + 1]):
+                    weight = column.get(self.__edges.get_id(normalize_edge(vertex, neighbors[index])))
+                    if weight is not None:
+                        weights[index] = weight
+        self.__weighted_adjacency[default] = (offsets, neighbors, weights)
+        return offsets, neighbors, weights
+
+    def view(self, excluded_vertices: Iterable[Vertex] = (), excluded_edges: Iterable[Edge] = ()) -> GraphView:
+        return GraphView(self, excluded_vertices, excluded_edges)
+
     def get_quantity_of_vertices(self) -> int:
         return self.quantity_of_vertices
     
     def is_empty(self) -> bool:
-        representation_priority = [GraphRepresentationType.INCIDENCE, GraphRepresentationType.ADJACENCY_LIST, GraphRepresentationType.ADJACENCY_MATRIX]
-        representation = self.__get_first_disponible_representation(representation_priority)
-        return representation.is_empty()
+        return len(self.__edges) == 0
     
     def is_complete_graph(self) -> bool:
-        representation_priority = [GraphRepresentationType.INCIDENCE, GraphRepresentationType.ADJACENCY_LIST, GraphRepresentationType.ADJACENCY_MATRIX]
-        representation = self.__get_first_disponible_representation(representation_priority)
-        return representation.is_complete_graph()
+        total_edges = self.quantity_of_vertices * (self.quantity_of_vertices - 1) // 2
+        return len(self.__edges) == total_edges
     
-    def export_graph(self) -> str:
-        representation_priority = [GraphRepresentationType.INCIDENCE, GraphRepresentationType.ADJACENCY_LIST, GraphRepresentationType.ADJACENCY_MATRIX]
+    def export_graph(self, output_path: str | None = None,
+                     node_attributes: dict[str, Mapping | Sequence] | None = None,
+                     edge_attributes: dict[str, Mapping] | None = None) -> str:
+        representation_priority = [GraphRepresentationType.INCIDENCE, GraphRepresentationType.ADJACENCY_LIST, GraphRepresentationType.CSR, GraphRepresentationType.ADJACENCY_MATRIX]
         representation = self.__get_first_disponible_representation(representation_priority)
-        return representation.export_graph(output_dir=None, edges_info=self.__edges_info, vertices_info=self.__vertexes_info)
\ No newline at end of file
+        return representation.export_graph(output_path=output_path, edges_info=self.get_all_edge_info, vertices_info=self.__vertexes_info.get_all,
+                                           node_attributes=node_attributes, edge_attributes=edge_attributes)
\ No newline at end of file
@@ -0,0 +1,118 @@
+import numbers
+import operator
+import sys
+from array import array
+from typing import Any
+
+
+def as_python_number(value: Any) -> Any:
+    # Números de outras bibliotecas (numpy.int64, numpy.float32, ...) viram int/float do Python, para que as colunas
+    # continuem tipadas; qualquer outro valor é devolvido como veio
+    if isinstance(value, (bool, int, float)) or not isinstance(value, numbers.Number):
+        return value
+    if isinstance(value, numbers.Integral):
+        return operator.index(value)
+    if isinstance(value, numbers.Real):
+        return float(value)
+    return value
+
+
+class AttributeColumn:
+    # Uma coluna guarda o valor de um atributo para todos os índices (vértices ou ids de arestas).
+    # Começa como array('q') de inteiros, vira array('d') se aparecer um float e lista para qualquer outro tipo;
+    # strings são internadas, então rótulos repetidos compartilham o mesmo objeto.
+    def __init__(self):
+        self.__values: array | list = array('q')
+        self.__present = bytearray()
+
+    @classmethod
+    def from_values(cls, values: array | list, present: bytearray) -> "AttributeColumn":
+        column = cls()
+        column.__values = values
+        column.__present = present
+        return column
+
+    def __promote(self, value: Any) -> None:
+        if isinstance(self.__values, list):
+            return
+        if self.__values.typecode == 'q' and isinstance(value, float):
+            self.__values = array('d', self.__values)
+        elif not isinstance(value, (int, float)) or isinstance(value, bool):
+            self.__values = list(self.__values)
+
+    def __ensure_size(self, size: int) -> None:
+        missing = size - len(self.__present)
+        if missing <= 0:
+            return
+        self.__present.extend(bytes(missing))
+        if isinstance(self.__values, list):
+            self.__values.extend([None] * missing)
+        else:
+            self.__values.extend(array(self.__values.typecode, [0]) * missing)
+
+    def set(self, index: int, value: Any) -> None:
+        if isinstance(value, str):
+            value = sys.intern(value)
+        else:
+            value = as_python_number(value)
+        self.__promote(value)
+        self.__ensure_size(index + 1)
+        try:
+            self.__values[index] = value
+        except OverflowError:
+            self.__values = list(self.__values)
+            self.__values[index] = value
+        self.__present[index] = 1
+
+    def get(self, index: int) -> Any:
+        if index >= len(self.__present) or not self.__present[index]:
+            return None
+        return self.__values[index]
+
+    def delete(self, index: int) -> None:
+        if index < len(self.__present):
+            self.__present[index] = 0
+
+    def get_values(self) -> array | list:
+        return self.__values
+
+    def get_present(self) -> bytearray:
+        return self.__present
+
+    def get_typecode(self) -> str | None:
+        return None if isinstance(self.__values, list) else self.__values.typecode
+
+
+class AttributeStore:
+    def __init__(self):
+        self.__columns: dict[Any, AttributeColumn] = {}
+
+    def set(self, info_type: Any, index: int, value: Any) -> None:
+        if info_type not in self.__columns:
+            self.__columns[info_type] = AttributeColumn()
+        self.__columns[info_type].set(index, value)
+
+    def get(self, info_type: Any, index: int) -> Any:
+        column = self.__columns.get(info_type)
+        return column.get(index) if column is not None else None
+
+    def get_all(self, index: int) -> dict[Any, Any]:
+        info = {}
+        for info_type, column in self.__columns.items():
+            value = column.get(index)
+            if value is not None:
+                info[info_type] = value
+        return info
+
+    def delete(self, index: int) -> None:
+        for column in self.__columns.values():
+            column.delete(index)
+
+    def get_column(self, info_type: Any) -> AttributeColumn | None:
+        return self.__columns.get(info_type)
+
+    def get_columns(self) -> dict[Any, AttributeColumn]:
+        return dict(self.__columns)
+
+    def set_column(self, info_type: Any, column: AttributeColumn) -> None:
+        self.__columns[info_type] = column
@@ -0,0 +1,109 @@
+from array import array
+from collections import deque
+from typing import Callable, Iterable
+
+from models.graph.graph_components.vertex import Vertex
+
+
+class ComponentIndex:
+    # Union-find (compressão de caminho + união por tamanho) mantido enquanto as arestas são criadas e removidas.
+    # O union-find trabalha com "nós", e cada vértice aponta para um nó (node_of); vários vértices podem apontar para o mesmo nó.
+    # Assim, quando uma remoção separa um pedaço de um componente, basta apontar os vértices desse pedaço para um nó novo,
+    # sem mexer no resto do componente. Os nós antigos continuam nos caminhos do resto e são descartados na compactação.
+    def __init__(self, quantity_of_vertices: int = 0):
+        self.__node_of = array('l', range(quantity_of_vertices))
+        self.__parents = array('l', range(quantity_of_vertices))
+        self.__sizes = array('l', [1]) * quantity_of_vertices
+        # Vértice que representa o componente de cada nó raiz
+        self.__representatives = array('l', range(quantity_of_vertices))
+
+    def __add_node(self, size: int, representative: Vertex) -> int:
+        node = len(self.__parents)
+        self.__parents.append(node)
+        self.__sizes.append(size)
+        self.__representatives.append(representative)
+        return node
+
+    def add_vertex(self) -> None:
+        self.__node_of.append(self.__add_node(1, len(self.__node_of)))
+
+    def __find_root(self, node: int) -> int:
+        parents = self.__parents
+        root = node
+        while parents[root] != root:
+            root = parents[root]
+        while parents[node] != root:
+            parents[node], node = root, parents[node]
+        return root
+
+    def find(self, vertex: Vertex) -> Vertex:
+        return self.__representatives[self.__find_root(self.__node_of[vertex])]
+
+    def union(self, vertex_a: Vertex, vertex_b: Vertex) -> None:
+        root_a, root_b = self.__find_root(self.__node_of[vertex_a]), self.__find_root(self.__node_of[vertex_b])
+        if root_a == root_b:
+            return
+        if self.__sizes[root_a] < self.__sizes[root_b]:
+            root_a, root_b = root_b, root_a
+        self.__parents[root_b] = root_a
+        self.__sizes[root_a] += self.__sizes[root_b]
+
+    def remove_edge(self, vertex_a: Vertex, vertex_b: Vertex, get_neighbors: Callable[[Vertex], Iterable[Vertex]]) -> None:
+        # Chamado depois que a aresta já saiu do grafo. Busca em largura a partir das duas pontas, alternando um vértice
+        # de cada lado: se os lados se encontram o componente continua inteiro; se um lado acaba antes, ele é o pedaço
+        # que se separou. O custo é proporcional ao menor dos dois lados, e não ao grafo inteiro
+        if vertex_a == vertex_b:
+            return
+        visited = ({vertex_a}, {vertex_b})
+        queues = (deque([vertex_a]), deque([vertex_b]))
+        while queues[0] and queues[1]:
+            for side in (0, 1):
+                vertex = queues[side].popleft()
+                for neighbor in get_neighbors(vertex):
+                    if neighbor in visited[1 - side]:
+                        return
+                    if neighbor not in visited[side]:
+                        visited[side].add(neighbor)
+                        queues[side].append(neighbor)
+                if not queues[side]:
+                    self.__split(visited[side], vertex_b if side == 0 else vertex_a)
+                    return
+
+    def __split(self, piece: set[Vertex], remaining_vertex: Vertex) -> None:
+        root = self.__find_root(self.__node_of[remaining_vertex])
+        self.__sizes[root] -= len(piece)
+        if self.__representatives[root] in piece:
+            self.__representatives[root] = remaining_vertex
+        node = self.__add_node(len(piece), min(piece))
+        for vertex in piece:
+            self.__node_of[vertex] = node
+        if len(self.__parents) > 2 * len(self.__node_of):
+            self.__compact()
+
+    def __compact(self) -> None:
+        # Renumera só os nós raiz ainda usados, apontando cada vértice direto para a raiz do seu componente
+        new_nodes: dict[int, int] = {}
+        parents, sizes, representatives = array('l'), array('l'), array('l')
+        node_of = array('l', [0]) * len(self.__node_of)
+        for vertex in range(len(self.__node_of)):
+            root = self.__find_root(self.__node_of[vertex])
+            if root not in new_nodes:
+                new_nodes[root] = len(parents)
+                parents.append(len(parents))
+                sizes.append(self.__sizes[root])
+                representatives.append(self.__representatives[root])
+            node_of[vertex] = new_nodes[root]
+        self.__node_of, self.__parents, self.__sizes, self.__representatives = node_of, parents, sizes, representatives
+
+    def get_size(self, vertex: Vertex) -> int:
+        return self.__sizes[self.__find_root(self.__node_of[vertex])]
+
+    def get_sizes(self) -> dict[Vertex, int]:
+        # Todo nó raiz tem pelo menos um vértice: os nós descartados nunca são raiz
+        return {self.__representatives[node]: self.__sizes[node] for node, parent in enumerate(self.__parents) if node == parent}
+
+    def get_components(self) -> list[list[Vertex]]:
+        components: dict[int, list[Vertex]] = {}
+        for vertex in range(len(self.__node_of)):
+            components.setdefault(self.__find_root(self.__node_of[vertex]), []).append(vertex)
+        return list(components.values())
@@ -0,0 +1,53 @@
+from array import array
+from typing import Any
+
+from models.graph.graph_components.vertex import Vertex
+
+
+class DegreeIndex:
+    # Grau e grau ponderado de cada vértice, atualizados a cada aresta criada/removida ou peso alterado,
+    # para não precisar percorrer as arestas do grafo a cada consulta. Laços (v, v) contam uma vez.
+    def __init__(self, quantity_of_vertices: int = 0):
+        self.__degrees = array('l', [0]) * quantity_of_vertices
+        self.__weighted_degrees: array = array('q', [0]) * quantity_of_vertices
+
+    def add_vertex(self) -> None:
+        self.__degrees.append(0)
+        self.__weighted_degrees.append(0)
+
+    def __add_weight(self, vertex: Vertex, weight: Any) -> None:
+        if isinstance(weight, float) and self.__weighted_degrees.typecode == 'q':
+            self.__weighted_degrees = array('d', self.__weighted_degrees)
+        self.__weighted_degrees[vertex] += weight
+
+    def add_edge(self, vertex_a: Vertex, vertex_b: Vertex) -> None:
+        self.__degrees[vertex_a] += 1
+        if vertex_a != vertex_b:
+            self.__degrees[vertex_b] += 1
+
+    def remove_edge(self, vertex_a: Vertex, vertex_b: Vertex, weight: Any = None) -> None:
+        self.__degrees[vertex_a] -= 1
+        if vertex_a != vertex_b:
+            self.__degrees[vertex_b] -= 1
+        if weight is not None:
+            self.update_weight(vertex_a, vertex_b, weight, None)
+
+    def update_weight(self, vertex_a: Vertex, vertex_b: Vertex, old_weight: Any, new_weight: Any) -> None:
+        delta = (new_weight or 0) - (old_weight or 0)
+        if not delta:
+            return
+        self.__add_weight(vertex_a, delta)
+        if vertex_a != vertex_b:
+            self.__add_weight(vertex_b, delta)
+
+    def get_degree(self, vertex: Vertex) -> int:
+        return self.__degrees[vertex]
+
+    def get_weighted_degree(self, vertex: Vertex) -> int | float:
+        return self.__weighted_degrees[vertex]
+
+    def get_degrees(self) -> array:
+        return self.__degrees
+
+    def get_weighted_degrees(self) -> array:
+        return self.__weighted_degrees
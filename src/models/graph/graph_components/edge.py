@@ -5,5 +5,11 @@ from models.graph.graph_components.vertex import Vertex
 class EdgeInfoTypes(StrEnum):
     LABEL = "label"
     WEIGHT = "weight"
+    # Pesos por sentido de uma aresta canônica (menor, maior): FORWARD é de menor para maior, BACKWARD o contrário
+    FORWARD_WEIGHT = "forward_weight"
+    BACKWARD_WEIGHT = "backward_weight"
 
-Edge = tuple[Vertex, Vertex]
\ No newline at end of file
+Edge = tuple[Vertex, Vertex]
+
+def normalize_edge(vertex_a: Vertex, vertex_b: Vertex) -> Edge:
+    return (vertex_a, vertex_b) if vertex_a <= vertex_b else (vertex_b, vertex_a)
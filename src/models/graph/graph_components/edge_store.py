@@ -0,0 +1,70 @@
+from array import array
+from typing import Iterator
+
+from models.graph.graph_components.edge import Edge, normalize_edge
+from models.graph.graph_components.vertex import Vertex
+
+
+class EdgeStore:
+    # Fonte única das arestas do grafo. Toda aresta não direcionada é guardada uma única vez como (menor, maior),
+    # então (a, b) e (b, a) são a mesma aresta. As representações do grafo são construídas a partir daqui.
+    # Cada aresta tem um id estável enquanto existir, usado para indexar os atributos; ids removidos são reaproveitados.
+    def __init__(self):
+        self.__edges: dict[Edge, int] = {}
+        self.__edge_sources = array('l')
+        self.__edge_targets = array('l')
+        self.__free_edge_ids: list[int] = []
+
+    @classmethod
+    def from_arrays(cls, edge_sources: array, edge_targets: array) -> "EdgeStore":
+        # As arestas já precisam estar na forma canônica e sem repetição, como saem de get_edge_arrays
+        edge_store = cls()
+        edge_store.__edge_sources = array('l', edge_sources)
+        edge_store.__edge_targets = array('l', edge_targets)
+        edge_store.__edges = dict(zip(zip(edge_store.__edge_sources, edge_store.__edge_targets), range(len(edge_sources))))
+        return edge_store
+
+    def add(self, vertex_a: Vertex, vertex_b: Vertex) -> bool:
+        edge = normalize_edge(vertex_a, vertex_b)
+        if edge in self.__edges:
+            return False
+        if self.__free_edge_ids:
+            edge_id = self.__free_edge_ids.pop()
+            self.__edge_sources[edge_id], self.__edge_targets[edge_id] = edge
+        else:
+            edge_id = len(self.__edge_sources)
+            self.__edge_sources.append(edge[0])
+            self.__edge_targets.append(edge[1])
+        self.__edges[edge] = edge_id
+        return True
+
+    def remove(self, vertex_a: Vertex, vertex_b: Vertex) -> int | None:
+        edge_id = self.__edges.pop(normalize_edge(vertex_a, vertex_b), None)
+        if edge_id is not None:
+            self.__free_edge_ids.append(edge_id)
+        return edge_id
+
+    def get_id(self, edge: Edge) -> int | None:
+        return self.__edges.get(normalize_edge(edge[0], edge[1]))
+
+    def get_edge(self, edge_id: int) -> Edge:
+        return self.__edge_sources[edge_id], self.__edge_targets[edge_id]
+
+    def get_edge_arrays(self) -> tuple[array, array]:
+        edge_sources, edge_targets = array('l'), array('l')
+        for vertex_a, vertex_b in self.__edges:
+            edge_sources.append(vertex_a)
+            edge_targets.append(vertex_b)
+        return edge_sources, edge_targets
+
+    def get_ids(self) -> Iterator[int]:
+        return iter(self.__edges.values())
+
+    def __contains__(self, edge: Edge) -> bool:
+        return normalize_edge(edge[0], edge[1]) in self.__edges
+
+    def __len__(self) -> int:
+        return len(self.__edges)
+
+    def __iter__(self) -> Iterator[Edge]:
+        return iter(self.__edges)
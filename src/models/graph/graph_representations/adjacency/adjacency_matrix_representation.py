@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from models.graph.graph_components.edge import Edge
 from models.graph.graph_components.vertex import Vertex
 from models.graph.graph_representations.graph_representation import GraphRepresentation
@@ -5,24 +7,69 @@ from models.graph.graph_representations.graph_representations_types import Graph
 
 
 class AdjacencyMatrixRepresentation(GraphRepresentation):
+    # Cada linha da matriz é um bitset guardado num único bytearray: o bit j da linha i indica a aresta (i, j).
+    # As operações por linha convertem o bitset em int para trabalhar com palavras inteiras em vez de célula a célula.
     def __init__(self, quantity_of_vertices: int):
         super().__init__(GraphRepresentationType.ADJACENCY_MATRIX, quantity_of_vertices)
-        row = [0] * quantity_of_vertices
-        self.__adjacency_matrix = [row[:] for _ in range(quantity_of_vertices)]
+        self.__row_size = (quantity_of_vertices + 7) // 8
+        self.__adjacency_matrix = bytearray(self.__row_size * quantity_of_vertices)
         self.__quantity_of_edges = 0
 
+    def __resize_rows(self, row_size: int) -> None:
+        quantity_of_rows = len(self.__adjacency_matrix) // self.__row_size if self.__row_size else 0
+        resized_matrix = bytearray(row_size * quantity_of_rows)
+        for row in range(quantity_of_rows):
+            old_start = row * self.__row_size
+            resized_matrix[row * row_size:row * row_size + self.__row_size] = self.__adjacency_matrix[old_start:old_start + self.__row_size]
+        self.__adjacency_matrix = resized_matrix
+        self.__row_size = row_size
+
+    def add_vertex(self) -> Vertex:
+        # As linhas crescem dobrando de tamanho, então adicionar vértices um a um custa O(1) amortizado por coluna
+        vertex = super().add_vertex()
+        if self.quantity_of_vertices > self.__row_size * 8:
+            self.__resize_rows(max(1, self.__row_size * 2))
+        self.__adjacency_matrix.extend(bytes(self.__row_size))
+        return vertex
+
+    def __get_bit_position(self, vertex_a: Vertex, vertex_b: Vertex) -> tuple[int, int]:
+        return vertex_a * self.__row_size + (vertex_b >> 3), 1 << (vertex_b & 7)
+
+    def __set_cell(self, vertex_a: Vertex, vertex_b: Vertex, value: bool) -> None:
+        index, mask = self.__get_bit_position(vertex_a, vertex_b)
+        if value:
+            self.__adjacency_matrix[index] |= mask
+        else:
+            self.__adjacency_matrix[index] &= ~mask
+
+    def __get_row(self, vertex: Vertex) -> int:
+        start = vertex * self.__row_size
+        return int.from_bytes(self.__adjacency_matrix[start:start + self.__row_size], 'little')
+
+    @staticmethod
+    def __iter_bits(row: int):
+        while row:
+            lowest_bit = row & -row
+            yield lowest_bit.bit_length() - 1
+            row ^= lowest_bit
+
     def create_edge(self, vertex_a: Vertex, vertex_b: Vertex) -> None:
-        self.__adjacency_matrix[vertex_a][vertex_b] = 1
-        self.__adjacency_matrix[vertex_b][vertex_a] = 1
+        if self.is_adjacent_vertex(vertex_a, vertex_b):
+            return
+        self.__set_cell(vertex_a, vertex_b, True)
+        self.__set_cell(vertex_b, vertex_a, True)
         self.__quantity_of_edges += 1
 
     def delete_edge(self, vertex_a: Vertex, vertex_b: Vertex) -> None:
-        self.__adjacency_matrix[vertex_a][vertex_b] = 0
-        self.__adjacency_matrix[vertex_b][vertex_a] = 0
+        if not self.is_adjacent_vertex(vertex_a, vertex_b):
+            return
+        self.__set_cell(vertex_a, vertex_b, False)
+        self.__set_cell(vertex_b, vertex_a, False)
         self.__quantity_of_edges -= 1
 
     def is_adjacent_vertex(self, vertex_a: Vertex, vertex_b: Vertex) -> bool:
-        return self.__adjacency_matrix[vertex_a][vertex_b] == 1
+        index, mask = self.__get_bit_position(vertex_a, vertex_b)
+        return self.__adjacency_matrix[index] & mask != 0
 
     def is_adjacent_edges(self, edge_a: Edge, edge_b: Edge) -> bool:
         for vertex_a in edge_a:
@@ -33,28 +80,34 @@ class AdjacencyMatrixRepresentation(GraphRepresentation):
 
     def is_edge_incidencing_in_vertex(self, edge: Edge, vertex: Vertex) -> bool:
         return self.is_adjacent_vertex(edge[0], vertex) or self.is_adjacent_vertex(edge[1], vertex)
-    
+
     def edge_exists(self, edge: Edge) -> bool:
         return self.is_adjacent_vertex(edge[0], edge[1])
-    
+
     def get_quantity_of_edges(self) -> int:
         return self.__quantity_of_edges
 
     def is_empty(self) -> bool:
-        for row in self.__adjacency_matrix:
-            for value in row:
-                if value != 0:
-                    return False
-        return True
+        return self.__adjacency_matrix.count(0) == len(self.__adjacency_matrix)
 
     def is_complete_graph(self) -> bool:
         total_edges = self.quantity_of_vertices * (self.quantity_of_vertices - 1) // 2
         return self.__quantity_of_edges == total_edges
-    
-    def get_edges(self):
-        edges = set()
+
+    def iter_edges(self) -> Iterator[Edge]:
         for i in range(self.quantity_of_vertices):
-            for j in range(i + 1, self.quantity_of_vertices):
-                if self.__adjacency_matrix[i][j] == 1:
-                    edges.add((i, j))
-        return edges
\ No newline at end of file
+            upper_row = self.__get_row(i) >> (i + 1) << (i + 1)
+            for j in self.__iter_bits(upper_row):
+                yield (i, j)
+
+    def get_edges(self):
+        return set(self.iter_edges())
+
+    def get_neighbors(self, vertex: Vertex) -> list[Vertex]:
+        return list(self.__iter_bits(self.__get_row(vertex)))
+
+    def get_common_neighbors(self, vertex_a: Vertex, vertex_b: Vertex) -> list[Vertex]:
+        return list(self.__iter_bits(self.__get_row(vertex_a) & self.__get_row(vertex_b)))
+
+    def count_common_neighbors(self, vertex_a: Vertex, vertex_b: Vertex) -> int:
+        return (self.__get_row(vertex_a) & self.__get_row(vertex_b)).bit_count()
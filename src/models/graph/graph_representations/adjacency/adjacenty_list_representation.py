@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from models.graph.graph_components.edge import Edge
 from models.graph.graph_components.vertex import Vertex
 from models.graph.graph_representations.graph_representation import GraphRepresentation
@@ -10,18 +12,23 @@ class AdjacencyListRepresentation(GraphRepresentation):
         self.__adjacency_lists: list[set[Vertex]] = [set() for _ in range(quantity_of_vertices)]
         self.__quantity_of_edges = 0
 
+    def add_vertex(self) -> Vertex:
+        vertex = super().add_vertex()
+        self.__adjacency_lists.append(set())
+        return vertex
+
     def create_edge(self, vertex_a: Vertex, vertex_b: Vertex) -> None:
-        if vertex_b not in self.__adjacency_lists[vertex_a]:
-            self.__adjacency_lists[vertex_a].add(vertex_b)
-        if vertex_a not in self.__adjacency_lists[vertex_b]:
-            self.__adjacency_lists[vertex_b].add(vertex_a)
+        if vertex_b in self.__adjacency_lists[vertex_a]:
+            return
+        self.__adjacency_lists[vertex_a].add(vertex_b)
+        self.__adjacency_lists[vertex_b].add(vertex_a)
         self.__quantity_of_edges += 1
 
     def delete_edge(self, vertex_a: Vertex, vertex_b: Vertex) -> None:
-        if vertex_b in self.__adjacency_lists[vertex_a]:
-            self.__adjacency_lists[vertex_a].remove(vertex_b)
-        if vertex_a in self.__adjacency_lists[vertex_b]:
-            self.__adjacency_lists[vertex_b].remove(vertex_a)
+        if vertex_b not in self.__adjacency_lists[vertex_a]:
+            return
+        self.__adjacency_lists[vertex_a].discard(vertex_b)
+        self.__adjacency_lists[vertex_b].discard(vertex_a)
         self.__quantity_of_edges -= 1
     
     def is_adjacent_vertex(self, vertex_a: Vertex, vertex_b: Vertex) -> bool:
@@ -51,6 +58,15 @@ class AdjacencyListRepresentation(GraphRepresentation):
         quantity_of_edges = self.get_quantity_of_edges()
         return quantity_of_edges == total_edges
 
+    def iter_edges(self) -> Iterator[Edge]:
+        for vertex, adjacents in enumerate(self.__adjacency_lists):
+            for adjacent in adjacents:
+                if vertex <= adjacent:
+                    yield (vertex, adjacent)
+
+    def get_neighbors(self, vertex: Vertex) -> set[Vertex]:
+        return self.__adjacency_lists[vertex]
+
     def get_edges(self) -> set[Edge]:
         edges = set()
         for vertex, adjacents in enumerate(self.__adjacency_lists):
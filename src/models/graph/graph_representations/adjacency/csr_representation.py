@@ -0,0 +1,167 @@
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Iterator
+
+from models.graph.graph_components.edge import Edge, normalize_edge
+from models.graph.graph_components.vertex import Vertex
+from models.graph.graph_representations.graph_representation import GraphRepresentation
+from models.graph.graph_representations.graph_representations_types import GraphRepresentationType
+
+
+class CSRRepresentation(GraphRepresentation):
+    # Compressed sparse row: os vizinhos do vértice v ficam em neighbors[offsets[v]:offsets[v + 1]], ordenados.
+    # É uma estrutura de leitura, então inserções e remoções ficam pendentes e só são compactadas
+    # nos arrays quando alguma consulta precisa percorrer as linhas.
+    def __init__(self, quantity_of_vertices: int, edges: Iterable[Edge] | None = None):
+        super().__init__(GraphRepresentationType.CSR, quantity_of_vertices)
+        self.__offsets = array('l', [0]) * (quantity_of_vertices + 1)
+        self.__neighbors = array('l')
+        self.__quantity_of_edges = 0
+        self.__pending_insertions: set[Edge] = set()
+        # As mesmas inserções pendentes, indexadas pelas duas pontas, para iter_current_neighbors
+        self.__pending_insertions_by_vertex: dict[Vertex, set[Vertex]] = {}
+        self.__pending_deletions: set[Edge] = set()
+        if edges is not None:
+            self.__build(edges)
+
+    def __build(self, edges: Iterable[Edge]) -> None:
+        normalized_edges = {normalize_edge(vertex_a, vertex_b) for vertex_a, vertex_b in edges}
+        degrees = array('l', [0]) * self.quantity_of_vertices
+        for vertex_a, vertex_b in normalized_edges:
+            degrees[vertex_a] += 1
+            if vertex_a != vertex_b:
+                degrees[vertex_b] += 1
+
+        offsets = array('l', [0]) * (self.quantity_of_vertices + 1)
+        for vertex in range(self.quantity_of_vertices):
+            offsets[vertex + 1] = offsets[vertex] + degrees[vertex]
+
+        cursors = offsets[:-1]
+        neighbors = array('l', [0]) * offsets[-1]
+        for vertex_a, vertex_b in normalized_edges:
+            neighbors[cursors[vertex_a]] = vertex_b
+            cursors[vertex_a] += 1
+            if vertex_a != vertex_b:
+                neighbors[cursors[vertex_b]] = vertex_a
+                cursors[vertex_b] += 1
+
+        for vertex in range(self.quantity_of_vertices):
+            start, end = offsets[vertex], offsets[vertex + 1]
+            if end - start > 1:
+                neighbors[start:end] = array('l', sorted(neighbors[start:end]))
+
+        self.__offsets = offsets
+        self.__neighbors = neighbors
+        self.__quantity_of_edges = len(normalized_edges)
+
+    def __compact(self) -> None:
+        if not self.__pending_insertions and not self.__pending_deletions:
+            return
+        edges = self.__iter_compacted_edges()
+        edges = [edge for edge in edges if edge not in self.__pending_deletions]
+        edges.extend(self.__pending_insertions)
+        self.__pending_insertions = set()
+        self.__pending_insertions_by_vertex = {}
+        self.__pending_deletions = set()
+        self.__build(edges)
+
+    def __iter_compacted_edges(self) -> Iterable[Edge]:
+        for vertex in range(self.quantity_of_vertices):
+            start, end = self.__offsets[vertex], self.__offsets[vertex + 1]
+            for index in range(bisect_left(self.__neighbors, vertex, start, end), end):
+                yield (vertex, self.__neighbors[index])
+
+    def __row_contains(self, vertex_a: Vertex, vertex_b: Vertex) -> bool:
+        start, end = self.__offsets[vertex_a], self.__offsets[vertex_a + 1]
+        index = bisect_left(self.__neighbors, vertex_b, start, end)
+        return index < end and self.__neighbors[index] == vertex_b
+
+    def add_vertex(self) -> Vertex:
+        vertex = super().add_vertex()
+        self.__offsets.append(self.__offsets[-1])
+        return vertex
+
+    def __add_pending_insertion(self, edge: Edge) -> None:
+        self.__pending_deletions.discard(edge)
+        self.__pending_insertions.add(edge)
+        self.__pending_insertions_by_vertex.setdefault(edge[0], set()).add(edge[1])
+        self.__pending_insertions_by_vertex.setdefault(edge[1], set()).add(edge[0])
+
+    def create_edge(self, vertex_a: Vertex, vertex_b: Vertex) -> None:
+        self.__add_pending_insertion(normalize_edge(vertex_a, vertex_b))
+
+    def create_edges(self, edges: Iterable[Edge]) -> None:
+        for vertex_a, vertex_b in edges:
+            self.__add_pending_insertion(normalize_edge(vertex_a, vertex_b))
+        self.__compact()
+
+    def delete_edge(self, vertex_a: Vertex, vertex_b: Vertex) -> None:
+        edge = normalize_edge(vertex_a, vertex_b)
+        if edge in self.__pending_insertions:
+            self.__pending_insertions.discard(edge)
+            self.__pending_insertions_by_vertex[edge[0]].discard(edge[1])
+            self.__pending_insertions_by_vertex[edge[1]].discard(edge[0])
+        self.__pending_deletions.add(edge)
+
+    def is_adjacent_vertex(self, vertex_a: Vertex, vertex_b: Vertex) -> bool:
+        edge = normalize_edge(vertex_a, vertex_b)
+        if edge in self.__pending_deletions:
+            return False
+        if edge in self.__pending_insertions:
+            return True
+        return self.__row_contains(vertex_a, vertex_b)
+
+    def is_adjacent_edges(self, edge_a: Edge, edge_b: Edge) -> bool:
+        for vertex_a in edge_a:
+            for vertex_b in edge_b:
+                if self.is_adjacent_vertex(vertex_a, vertex_b):
+                    return True
+        return False
+
+    def is_edge_incidencing_in_vertex(self, edge: Edge, vertex: Vertex) -> bool:
+        return self.is_adjacent_vertex(edge[0], vertex) or self.is_adjacent_vertex(edge[1], vertex)
+
+    def edge_exists(self, edge: Edge) -> bool:
+        return self.is_adjacent_vertex(edge[0], edge[1])
+
+    def get_quantity_of_edges(self) -> int:
+        self.__compact()
+        return self.__quantity_of_edges
+
+    def is_empty(self) -> bool:
+        return self.get_quantity_of_edges() == 0
+
+    def is_complete_graph(self) -> bool:
+        total_edges = self.quantity_of_vertices * (self.quantity_of_vertices - 1) // 2
+        return self.get_quantity_of_edges() == total_edges
+
+    def get_edges(self) -> set[Edge]:
+        self.__compact()
+        return set(self.__iter_compacted_edges())
+
+    def iter_edges(self) -> Iterator[Edge]:
+        self.__compact()
+        return self.__iter_compacted_edges()
+
+    def get_neighbors(self, vertex: Vertex) -> array:
+        self.__compact()
+        return self.__neighbors[self.__offsets[vertex]:self.__offsets[vertex + 1]]
+
+    def iter_current_neighbors(self, vertex: Vertex) -> Iterator[Vertex]:
+        # Vizinhos atuais sem compactar: a linha do CSR menos as remoções pendentes, mais as inserções pendentes.
+        # Serve para buscas feitas no meio de uma sequência de mudanças (como a dos componentes a cada remoção),
+        # que remontariam o CSR inteiro a cada chamada se usassem get_neighbors
+        pending_deletions = self.__pending_deletions
+        for index in range(self.__offsets[vertex], self.__offsets[vertex + 1]):
+            neighbor = self.__neighbors[index]
+            if not pending_deletions or normalize_edge(vertex, neighbor) not in pending_deletions:
+                yield neighbor
+        yield from self.__pending_insertions_by_vertex.get(vertex, ())
+
+    def get_degree(self, vertex: Vertex) -> int:
+        self.__compact()
+        return self.__offsets[vertex + 1] - self.__offsets[vertex]
+
+    def get_csr_arrays(self) -> tuple[array, array]:
+        self.__compact()
+        return self.__offsets, self.__neighbors
@@ -0,0 +1,124 @@
+from datetime import date
+from typing import Any, Iterable, TextIO
+from xml.sax.saxutils import escape
+
+from models.graph.graph_components.edge import Edge
+from models.graph.graph_components.vertex import Vertex
+
+GEXF_HEADER = (
+    "<?xml version='1.0' encoding='utf-8'?>\n"
+    '<gexf xmlns="http://www.gexf.net/1.2draft" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+    'xsi:schemaLocation="http://www.gexf.net/1.2draft http://www.gexf.net/1.2draft/gexf.xsd" version="1.2">\n'
+)
+RESERVED_NODE_ATTRIBUTES = {"label"}
+RESERVED_EDGE_ATTRIBUTES = {"label", "weight"}
+
+# Escreve o GEXF direto no arquivo, em blocos de linhas, sem montar uma cópia do grafo em memória.
+# Os atributos precisam ser declarados antes dos nós, então os tipos são descobertos numa primeira passada pelos dados.
+
+
+def _quote(value: Any) -> str:
+    if isinstance(value, bool):
+        value = "true" if value else "false"
+    return '"' + escape(str(value), {'"': "&quot;"}) + '"'
+
+
+def _get_gexf_type(value: Any) -> str:
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "long"
+    if isinstance(value, float):
+        return "double"
+    return "string"
+
+
+def infer_attribute_types(infos: Iterable[dict[str, Any]], reserved: set[str]) -> dict[str, str]:
+    attribute_types = {}
+    for info in infos:
+        for name, value in info.items():
+            name = str(name)
+            if name in reserved or value is None:
+                continue
+            value_type = _get_gexf_type(value)
+            if attribute_types.get(name, value_type) != value_type:
+                value_type = "double" if {value_type, attribute_types[name]} == {"long", "double"} else "string"
+            attribute_types[name] = value_type
+    return attribute_types
+
+
+class GexfWriter:
+    def __init__(self, file: TextIO, node_attribute_types: dict[str, str] | None = None,
+                 edge_attribute_types: dict[str, str] | None = None, chunk_size: int = 1000):
+        self.__file = file
+        self.__node_attribute_ids = {name: str(index) for index, name in enumerate(node_attribute_types or {})}
+        self.__edge_attribute_ids = {name: str(index) for index, name in enumerate(edge_attribute_types or {})}
+        self.__node_attribute_types = node_attribute_types or {}
+        self.__edge_attribute_types = edge_attribute_types or {}
+        self.__chunk_size = chunk_size
+        self.__buffer: list[str] = []
+
+    def __write(self, line: str) -> None:
+        self.__buffer.append(line)
+        if len(self.__buffer) >= self.__chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        self.__file.write("".join(self.__buffer))
+        self.__buffer = []
+
+    def __write_attribute_declarations(self, attribute_class: str, attribute_ids: dict[str, str], attribute_types: dict[str, str]) -> None:
+        if not attribute_ids:
+            return
+        self.__write(f'    <attributes class="{attribute_class}" mode="static">\n')
+        for name, attribute_id in attribute_ids.items():
+            self.__write(f'      <attribute id="{attribute_id}" title={_quote(name)} type="{attribute_types[name]}" />\n')
+        self.__write("    </attributes>\n")
+
+    def __format_attribute_values(self, attribute_ids: dict[str, str], info: dict[str, Any]) -> str:
+        values = []
+        for name, value in info.items():
+            attribute_id = attribute_ids.get(str(name))
+            if attribute_id is not None and value is not None:
+                values.append(f'<attvalue for="{attribute_id}" value={_quote(value)} />')
+        if not values:
+            return ""
+        return "<attvalues>" + "".join(values) + "</attvalues>"
+
+    def write_header(self) -> None:
+        self.__write(GEXF_HEADER)
+        self.__write(f'  <meta lastmodifieddate="{date.today().isoformat()}">\n    <creator>trab-final-grafos</creator>\n  </meta>\n')
+        self.__write('  <graph defaultedgetype="undirected" mode="static" name="">\n')
+        self.__write_attribute_declarations("node", self.__node_attribute_ids, self.__node_attribute_types)
+        self.__write_attribute_declarations("edge", self.__edge_attribute_ids, self.__edge_attribute_types)
+
+    def write_nodes(self, nodes: Iterable[tuple[Vertex, dict[str, Any]]]) -> None:
+        self.__write("    <nodes>\n")
+        for vertex, info in nodes:
+            label = info.get("label")
+            label = vertex if label is None else label
+            attribute_values = self.__format_attribute_values(self.__node_attribute_ids, info)
+            if attribute_values:
+                self.__write(f'      <node id="{vertex}" label={_quote(label)}>{attribute_values}</node>\n')
+            else:
+                self.__write(f'      <node id="{vertex}" label={_quote(label)} />\n')
+        self.__write("    </nodes>\n")
+
+    def write_edges(self, edges: Iterable[tuple[Edge, dict[str, Any]]]) -> None:
+        self.__write("    <edges>\n")
+        for edge_id, (edge, info) in enumerate(edges):
+            attributes = f'source="{edge[0]}" target="{edge[1]}" id="{edge_id}"'
+            if info.get("label") is not None:
+                attributes += f' label={_quote(info["label"])}'
+            if info.get("weight") is not None:
+                attributes += f' weight={_quote(info["weight"])}'
+            attribute_values = self.__format_attribute_values(self.__edge_attribute_ids, info)
+            if attribute_values:
+                self.__write(f"      <edge {attributes}>{attribute_values}</edge>\n")
+            else:
+                self.__write(f"      <edge {attributes} />\n")
+        self.__write("    </edges>\n")
+
+    def write_footer(self) -> None:
+        self.__write("  </graph>\n</gexf>\n")
+        self.flush()
@@ -1,21 +1,31 @@
 import os
-import networkx as nx
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator, Mapping, Sequence
 
-from models.graph.graph_components.edge import Edge, EdgeInfoTypes
-from models.graph.graph_components.vertex import Vertex, VertexInfoTypes
+from models.graph.graph_components.edge import Edge
+from models.graph.graph_components.vertex import Vertex
+from models.graph.graph_representations.gexf_writer import GexfWriter, RESERVED_EDGE_ATTRIBUTES, RESERVED_NODE_ATTRIBUTES, infer_attribute_types
 from models.graph.graph_representations.graph_representations_types import GraphRepresentationType
 
+InfoSource = Mapping[Any, dict[Any, Any]] | Callable[[Any], dict[Any, Any]]
+
 class GraphRepresentation(ABC):
     def __init__(self, representation_type: GraphRepresentationType, quantity_of_vertices: int):
         self.representation_type = representation_type
         self.quantity_of_vertices = quantity_of_vertices
     
+    def add_vertex(self) -> Vertex:
+        self.quantity_of_vertices += 1
+        return self.quantity_of_vertices - 1
+
     @abstractmethod
     def create_edge(self, vertex_a: Vertex, vertex_b: Vertex) -> None:
         pass
 
+    def create_edges(self, edges: Iterable[Edge]) -> None:
+        for vertex_a, vertex_b in edges:
+            self.create_edge(vertex_a, vertex_b)
+
     @abstractmethod
     def delete_edge(self, vertex_a: Vertex, vertex_b: Vertex) -> None:
         pass
@@ -52,31 +62,60 @@ class GraphRepresentation(ABC):
     def get_edges(self) -> set[Edge]:
         raise NotImplementedError
 
-    def __get_gephi_graph(self, vertices_info: dict[Vertex, dict[VertexInfoTypes, Any]] | None, edges_info: dict[Edge, dict[EdgeInfoTypes, Any]] | None) -> nx.Graph:
-        gephi_graph = nx.Graph()
+    def iter_edges(self) -> Iterator[Edge]:
+        return iter(self.get_edges())
+
+    @staticmethod
+    def __get_info(info_source: InfoSource | None, key: Any) -> dict[Any, Any]:
+        if info_source is None:
+            return {}
+        if callable(info_source):
+            return info_source(key)
+        return info_source.get(key, {})
+
+    @staticmethod
+    def __with_extra_attributes(info: dict[Any, Any], extra_attributes: dict[str, Mapping | Sequence] | None, key: Any) -> dict[Any, Any]:
+        if not extra_attributes:
+            return info
+        info = dict(info)
+        for name, values in extra_attributes.items():
+            if isinstance(values, Mapping):
+                value = values.get(key)
+            else:
+                value = values[key] if isinstance(key, int) and key < len(values) else None
+            if value is not None:
+                info[name] = value
+        return info
+
+    def __iter_nodes(self, vertices_info: InfoSource | None, node_attributes: dict[str, Mapping | Sequence] | None) -> Iterator[tuple[Vertex, dict]]:
         for vertex in range(self.quantity_of_vertices):
-            gephi_graph.add_node(vertex, label=f"{vertex}")
-            if vertices_info and vertex in vertices_info:
-                nx.set_node_attributes(gephi_graph, {vertex: vertices_info[vertex]})
-        self.__fill_edges_in_gephi_graph(gephi_graph, edges_info)
-        return gephi_graph
-
-    def __fill_edges_in_gephi_graph(self, gephi_graph: nx.Graph, edges_info: dict[Edge, dict[EdgeInfoTypes, Any]] | None) -> None:
-        edges = self.get_edges()
-        for edge in edges:
-            edge_info = edges_info.get(edge, {}) if edges_info else {}
-            gephi_graph.add_edge(*edge, **edge_info)
-
-    def export_graph(self, output_dir: str | None = None, 
-                    edges_info: dict[Edge, dict[EdgeInfoTypes, Any]] | None = None, 
-                    vertices_info: dict[Vertex, dict[VertexInfoTypes, Any]] | None = None) -> str:
-        gephi_graph = self.__get_gephi_graph(vertices_info, edges_info)
-
-        if output_dir is None:
-            output_dir = os.getcwd()
+            yield vertex, self.__with_extra_attributes(self.__get_info(vertices_info, vertex), node_attributes, vertex)
+
+    def __iter_edges_with_info(self, edges_info: InfoSource | None, edge_attributes: dict[str, Mapping] | None) -> Iterator[tuple[Edge, dict]]:
+        for edge in self.iter_edges():
+            yield edge, self.__with_extra_attributes(self.__get_info(edges_info, edge), edge_attributes, edge)
+
+    def export_graph(self, output_path: str | None = None,
+                    edges_info: InfoSource | None = None,
+                    vertices_info: InfoSource | None = None,
+                    node_attributes: dict[str, Mapping | Sequence] | None = None,
+                    edge_attributes: dict[str, Mapping] | None = None,
+                    chunk_size: int = 1000) -> str:
+        # Os atributos podem vir como dicionários ou funções (vértice/aresta -> atributos), e node_attributes/edge_attributes
+        # acrescentam colunas calculadas por fora, como os scores de fragmentação
+        if output_path is None:
+            output_path = os.path.join(os.getcwd(), "graph_2.gexf")
+        output_dir = os.path.dirname(os.path.abspath(output_path))
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
 
-        gexf_file = os.path.join(output_dir, f"graph_2.gexf")
-        nx.write_gexf(gephi_graph, gexf_file)
-        return gexf_file
\ No newline at end of file
+        node_attribute_types = infer_attribute_types((info for _, info in self.__iter_nodes(vertices_info, node_attributes)), RESERVED_NODE_ATTRIBUTES)
+        edge_attribute_types = infer_attribute_types((info for _, info in self.__iter_edges_with_info(edges_info, edge_attributes)), RESERVED_EDGE_ATTRIBUTES)
+
+        with open(output_path, "w", encoding="utf-8") as gexf_file:
+            writer = GexfWriter(gexf_file, node_attribute_types, edge_attribute_types, chunk_size)
+            writer.write_header()
+            writer.write_nodes(self.__iter_nodes(vertices_info, node_attributes))
+            writer.write_edges(self.__iter_edges_with_info(edges_info, edge_attributes))
+            writer.write_footer()
+        return output_path
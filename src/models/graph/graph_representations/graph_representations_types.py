@@ -4,4 +4,5 @@ from enum import Enum
 class GraphRepresentationType(Enum):
     INCIDENCE = "incidence"
     ADJACENCY_MATRIX = "adjacency_matrix"
-    ADJACENCY_LIST = "adjacency_list"
\ No newline at end of file
+    ADJACENCY_LIST = "adjacency_list"
+    CSR = "csr"
\ No newline at end of file
@@ -1,79 +1,92 @@
-from models.graph.graph_components.edge import Edge
+from array import array
+from typing import Iterator
+
+from models.graph.graph_components.edge import Edge, normalize_edge
 from models.graph.graph_components.vertex import Vertex
 from models.graph.graph_representations.graph_representation import GraphRepresentation
 from models.graph.graph_representations.graph_representations_types import GraphRepresentationType
 
 
 class IncidenceRepresentation(GraphRepresentation):
+    # Cada aresta recebe um id a partir da forma canônica (menor, maior); os extremos ficam em arrays indexados pelo id
+    # e cada vértice guarda só os ids das arestas que incidem nele. Ids de arestas removidas são reaproveitados.
     def __init__(self, quantity_of_vertices: int):
         super().__init__(representation_type=GraphRepresentationType.INCIDENCE, quantity_of_vertices=quantity_of_vertices)
-        self.__vertex_edge_incidence: dict[Vertex, set[Edge]] = {vertex: set() for vertex in range(quantity_of_vertices)}
-        self.__edge_count = 0
-    
+        self.__edge_ids: dict[Edge, int] = {}
+        self.__edge_sources = array('l')
+        self.__edge_targets = array('l')
+        self.__free_edge_ids: list[int] = []
+        self.__vertex_edge_incidence: list[array] = [array('l') for _ in range(quantity_of_vertices)]
+
+    def add_vertex(self) -> Vertex:
+        vertex = super().add_vertex()
+        self.__vertex_edge_incidence.append(array('l'))
+        return vertex
+
     def create_edge(self, vertex_a: Vertex, vertex_b: Vertex):
-        edge = (vertex_a, vertex_b)
-        self.__vertex_edge_incidence[vertex_a].add(edge)
-        self.__vertex_edge_incidence[vertex_b].add(edge)
-        self.__edge_count += 1
-    
+        edge = normalize_edge(vertex_a, vertex_b)
+        if edge in self.__edge_ids:
+            return
+        if self.__free_edge_ids:
+            edge_id = self.__free_edge_ids.pop()
+            self.__edge_sources[edge_id], self.__edge_targets[edge_id] = edge
+        else:
+            edge_id = len(self.__edge_sources)
+            self.__edge_sources.append(edge[0])
+            self.__edge_targets.append(edge[1])
+        self.__edge_ids[edge] = edge_id
+        self.__vertex_edge_incidence[edge[0]].append(edge_id)
+        if edge[0] != edge[1]:
+            self.__vertex_edge_incidence[edge[1]].append(edge_id)
+
     def delete_edge(self, vertex_a: Vertex, vertex_b: Vertex):
-        edge = (vertex_a, vertex_b)
-        inverted_edge = (vertex_b, vertex_a)
-        if edge in self.__vertex_edge_incidence[vertex_a]:
-            self.__vertex_edge_incidence[vertex_a].remove(edge)
-        if inverted_edge in self.__vertex_edge_incidence[vertex_a]:
-            self.__vertex_edge_incidence[vertex_a].remove(inverted_edge)
-        if edge in self.__vertex_edge_incidence[vertex_b]:
-            self.__vertex_edge_incidence[vertex_b].remove(edge)
-        if inverted_edge in self.__vertex_edge_incidence[vertex_b]:
-            self.__vertex_edge_incidence[vertex_b].remove(inverted_edge)
-        self.__edge_count -= 1
-    
+        edge = normalize_edge(vertex_a, vertex_b)
+        edge_id = self.__edge_ids.pop(edge, None)
+        if edge_id is None:
+            return
+        self.__vertex_edge_incidence[edge[0]].remove(edge_id)
+        if edge[0] != edge[1]:
+            self.__vertex_edge_incidence[edge[1]].remove(edge_id)
+        self.__free_edge_ids.append(edge_id)
+
     def is_adjacent_vertex(self, vertex_a: Vertex, vertex_b: Vertex) -> bool:
-        for edge in self.__vertex_edge_incidence[vertex_a]:
-            v1, v2 = edge
-            if v1 == vertex_b or v2 == vertex_b:
-                return True
-        return False
-    
+        return normalize_edge(vertex_a, vertex_b) in self.__edge_ids
+
     def is_adjacent_edges(self, edge_a: Edge, edge_b: Edge) -> bool:
-        inverted_edge_a = (edge_a[1], edge_a[0])
-        inverted_edge_b = (edge_b[1], edge_b[0])
-        for vertex in self.__vertex_edge_incidence:
-            if (edge_a in self.__vertex_edge_incidence[vertex] and edge_b in self.__vertex_edge_incidence[vertex]) or \
-               (inverted_edge_a in self.__vertex_edge_incidence[vertex] and inverted_edge_b in self.__vertex_edge_incidence[vertex]):
-                return True
-        return False
-    
+        if not self.edge_exists(edge_a) or not self.edge_exists(edge_b):
+            return False
+        return edge_a[0] in edge_b or edge_a[1] in edge_b
+
     def is_edge_incidencing_in_vertex(self, edge: Edge, vertex: Vertex) -> bool:
-        inverted_edge = (edge[1], edge[0])
-        vertex_edges = self.__vertex_edge_incidence.get(vertex, set())
-        return edge in vertex_edges or inverted_edge in vertex_edges
+        return vertex in edge and self.edge_exists(edge)
 
     def edge_exists(self, edge: Edge) -> bool:
-        inverted_edge = (edge[1], edge[0])
-        for edge_vertices in self.__vertex_edge_incidence.values():
-            if edge_vertices == edge or edge_vertices == inverted_edge:
-                return True
-        return False
-    
+        return normalize_edge(edge[0], edge[1]) in self.__edge_ids
+
     def get_quantity_of_edges(self) -> int:
-        return self.__edge_count
+        return len(self.__edge_ids)
 
     def get_edges(self) -> set[Edge]:
-        edges = set()
-        for vertex, incident_edges in self.__vertex_edge_incidence.items():
-            for edge in incident_edges:
-                v1, v2 = edge
-                edges.add((v1, v2))
-        return edges
+        return set(self.__edge_ids)
+
+    def iter_edges(self) -> Iterator[Edge]:
+        return iter(self.__edge_ids)
 
     def is_empty(self) -> bool:
-        return self.__edge_count == 0
-    
+        return len(self.__edge_ids) == 0
+
     def is_complete_graph(self) -> bool:
         total_edges = self.quantity_of_vertices * (self.quantity_of_vertices - 1) // 2
-        return self.__edge_count == total_edges
-    
-    def get_incident_edges(self, vertex: Vertex) -> set[int]:
-        return self.__vertex_edge_incidence[vertex]
\ No newline at end of file
+        return len(self.__edge_ids) == total_edges
+
+    def get_edge_id(self, edge: Edge) -> int | None:
+        return self.__edge_ids.get(normalize_edge(edge[0], edge[1]))
+
+    def get_edge_by_id(self, edge_id: int) -> Edge:
+        return self.__edge_sources[edge_id], self.__edge_targets[edge_id]
+
+    def get_incident_edge_ids(self, vertex: Vertex) -> array:
+        return self.__vertex_edge_incidence[vertex]
+
+    def get_incident_edges(self, vertex: Vertex) -> set[Edge]:
+        return {(self.__edge_sources[edge_id], self.__edge_targets[edge_id]) for edge_id in self.__vertex_edge_incidence[vertex]}
@@ -0,0 +1,138 @@
+import json
+import os
+import struct
+import sys
+from array import array
+from dataclasses import dataclass, field
+
+from models.graph.graph_components.attribute_store import AttributeColumn
+
+SNAPSHOT_MAGIC = b"GRAPHSNAPSHOT\x01"
+SNAPSHOT_VERSION = 1
+LABEL_SEPARATOR = "\0"
+
+# Snapshot binário de um grafo: um cabeçalho JSON descrevendo os blocos, seguido dos bytes crus dos arrays
+# (extremos das arestas e colunas de atributos). Colunas de strings são gravadas como um único texto separado por \0.
+
+
+@dataclass
+class GraphSnapshot:
+    quantity_of_vertices: int
+    edge_sources: array
+    edge_targets: array
+    vertex_columns: dict[str, AttributeColumn] = field(default_factory=dict)
+    edge_columns: dict[str, AttributeColumn] = field(default_factory=dict)
+
+
+def _encode_column(name: str, column: AttributeColumn, blocks: list[bytes]) -> dict:
+    values = column.get_values()
+    typecode = column.get_typecode()
+    if typecode is None:
+        if any(value is not None and not isinstance(value, str) for value in values):
+            raise ValueError(f"Column {name} has values that cannot be stored in a snapshot")
+        encoded_values = LABEL_SEPARATOR.join(value or "" for value in values).encode("utf-8")
+        kind = "str"
+    else:
+        encoded_values = values.tobytes()
+        kind = typecode
+    blocks.append(encoded_values)
+    blocks.append(bytes(column.get_present()))
+    return {"name": str(name), "kind": kind, "size": len(values), "values_bytes": len(encoded_values), "present_bytes": len(column.get_present())}
+
+
+def _decode_column(description: dict, values_bytes: bytes, present_bytes: bytes) -> AttributeColumn:
+    present = bytearray(present_bytes)
+    if description["kind"] == "str":
+        values = values_bytes.decode("utf-8").split(LABEL_SEPARATOR) if description["size"] else []
+        values = [sys.intern(value) if present[index] else None for index, value in enumerate(values)]
+    else:
+        values = array(description["kind"])
+        values.frombytes(values_bytes)
+    return AttributeColumn.from_values(values, present)
+
+
+def write_graph_snapshot(path: str, fingerprint: str, snapshot: GraphSnapshot) -> None:
+    blocks = [snapshot.edge_sources.tobytes(), snapshot.edge_targets.tobytes()]
+    header = {
+        "version": SNAPSHOT_VERSION,
+        "fingerprint": fingerprint,
+        "byteorder": sys.byteorder,
+        "itemsize": snapshot.edge_sources.itemsize,
+        "quantity_of_vertices": snapshot.quantity_of_vertices,
+        "quantity_of_edges": len(snapshot.edge_sources),
+        "vertex_columns": [_encode_column(name, column, blocks) for name, column in snapshot.vertex_columns.items()],
+        "edge_columns": [_encode_column(name, column, blocks) for name, column in snapshot.edge_columns.items()],
+    }
+    encoded_header = json.dumps(header).encode("utf-8")
+
+    # Escreve num arquivo temporário e troca no final para nunca deixar um snapshot pela metade
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as file:
+        file.write(SNAPSHOT_MAGIC)
+        file.write(struct.pack("<I", len(encoded_header)))
+        file.write(encoded_header)
+        for block in blocks:
+            file.write(block)
+    os.replace(temporary_path, path)
+
+
+def _read_exactly(file, size: int) -> bytes:
+    data = file.read(size)
+    if len(data) != size:
+        raise ValueError("Truncated graph snapshot")
+    return data
+
+
+def read_graph_snapshot(path: str, fingerprint: str) -> GraphSnapshot | None:
+    # Devolve None quando o snapshot não existe, não corresponde às entradas atuais ou está truncado/corrompido,
+    # para o chamador reconstruir o grafo
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as file:
+            if file.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+                return None
+            (header_size,) = struct.unpack("<I", _read_exactly(file, 4))
+            header = json.loads(_read_exactly(file, header_size))
+            if header["version"] != SNAPSHOT_VERSION or header["fingerprint"] != fingerprint:
+                return None
+            if header["byteorder"] != sys.byteorder or header["itemsize"] != array('l').itemsize:
+                return None
+
+            edge_sources, edge_targets = array('l'), array('l')
+            edge_sources.frombytes(_read_exactly(file, header["quantity_of_edges"] * header["itemsize"]))
+            edge_targets.frombytes(_read_exactly(file, header["quantity_of_edges"] * header["itemsize"]))
+
+            def read_columns(descriptions: list[dict]) -> dict[str, AttributeColumn]:
+                columns = {}
+                for description in descriptions:
+                    values_bytes = _read_exactly(file, description["values_bytes"])
+                    present_bytes = _read_exactly(file, description["present_bytes"])
+                    column = _decode_column(description, values_bytes, present_bytes)
+                    if len(column.get_values()) != description["size"] or len(column.get_present()) != description["size"]:
+                        raise ValueError(f"Column {description['name']} does not match its header")
+                    columns[description["name"]] = column
+                return columns
+
+            vertex_columns = read_columns(header["vertex_columns"])
+            edge_columns = read_columns(header["edge_columns"])
+            if file.read(1):
+                raise ValueError("Unexpected data after graph snapshot")
+
+        quantity_of_vertices = header["quantity_of_vertices"]
+        if not isinstance(quantity_of_vertices, int) or quantity_of_vertices < 0:
+            raise ValueError("Invalid quantity of vertices in graph snapshot")
+        if any(not 0 <= vertex < quantity_of_vertices for vertex in edge_sources) or \
+                any(not 0 <= vertex < quantity_of_vertices for vertex in edge_targets):
+            raise ValueError("Edge endpoint out of range in graph snapshot")
+        if any(len(column.get_present()) > quantity_of_vertices for column in vertex_columns.values()) or \
+                any(len(column.get_present()) > len(edge_sources) for column in edge_columns.values()):
+            raise ValueError("Attribute column larger than the graph in graph snapshot")
+        # As arestas precisam vir na forma canônica e sem repetição, como o EdgeStore espera
+        if any(source > target for source, target in zip(edge_sources, edge_targets)) or \
+                len(set(zip(edge_sources, edge_targets))) != len(edge_sources):
+            raise ValueError("Invalid edges in graph snapshot")
+    except (ValueError, KeyError, IndexError, TypeError, struct.error, UnicodeDecodeError):
+        # json.JSONDecodeError é um ValueError
+        return None
+    return GraphSnapshot(quantity_of_vertices, edge_sources, edge_targets, vertex_columns, edge_columns)
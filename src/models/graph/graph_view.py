@@ -0,0 +1,72 @@
+from typing import TYPE_CHECKING, Any, Iterable
+
+from models.graph.graph_components.edge import Edge, EdgeInfoTypes, normalize_edge
+from models.graph.graph_components.vertex import Vertex, VertexInfoTypes
+
+if TYPE_CHECKING:
+    from models.graph.graph import Graph
+
+
+class GraphView:
+    # Visão somente leitura de um grafo com alguns vértices e arestas escondidos por máscara.
+    # Nada é copiado nem alterado no grafo original, então várias visões podem ser consultadas ao mesmo tempo
+    # (por exemplo, "e se este usuário saísse?") sem efeito colateral.
+    def __init__(self, graph: "Graph", excluded_vertices: Iterable[Vertex] = (), excluded_edges: Iterable[Edge] = ()):
+        self.__graph = graph
+        self.__excluded_vertices = frozenset(excluded_vertices)
+        self.__excluded_edges = frozenset(normalize_edge(edge[0], edge[1]) for edge in excluded_edges)
+
+    def __is_edge_visible(self, vertex_a: Vertex, vertex_b: Vertex) -> bool:
+        if vertex_a in self.__excluded_vertices or vertex_b in self.__excluded_vertices:
+            return False
+        return normalize_edge(vertex_a, vertex_b) not in self.__excluded_edges
+
+    def is_vertex_visible(self, vertex: Vertex) -> bool:
+        return 0 <= vertex < self.__graph.get_quantity_of_vertices() and vertex not in self.__excluded_vertices
+
+    def view(self, excluded_vertices: Iterable[Vertex] = (), excluded_edges: Iterable[Edge] = ()) -> "GraphView":
+        return GraphView(self.__graph, self.__excluded_vertices.union(excluded_vertices), self.__excluded_edges.union(excluded_edges))
+
+    def get_vertices(self) -> list[Vertex]:
+        return [vertex for vertex in range(self.__graph.get_quantity_of_vertices()) if vertex not in self.__excluded_vertices]
+
+    def get_quantity_of_vertices(self) -> int:
+        return len(self.get_vertices())
+
+    def get_edges(self) -> list[Edge]:
+        return [edge for edge in self.__graph.get_edges() if self.__is_edge_visible(edge[0], edge[1])]
+
+    def get_quantity_of_edges(self) -> int:
+        return len(self.get_edges())
+
+    def get_neighbors(self, vertex: Vertex) -> list[Vertex]:
+        if vertex in self.__excluded_vertices:
+            return []
+        return [neighbor for neighbor in self.__graph.get_neighbors(vertex) if self.__is_edge_visible(vertex, neighbor)]
+
+    def edge_exists(self, edge: Edge) -> bool:
+        return self.__is_edge_visible(edge[0], edge[1]) and self.__graph.edge_exists(edge)
+
+    def is_vertexes_adjacent(self, vertex_a: Vertex, vertex_b: Vertex) -> bool:
+        return self.__is_edge_visible(vertex_a, vertex_b) and self.__graph.is_vertexes_adjacent(vertex_a, vertex_b)
+
+    def is_edges_adjacent(self, edge_a: Edge, edge_b: Edge) -> bool:
+        if not self.edge_exists(edge_a) or not self.edge_exists(edge_b):
+            return False
+        return self.__graph.is_edges_adjacent(edge_a, edge_b)
+
+    def is_edge_incidencing_in_vertex(self, edge: Edge, vertex: Vertex) -> bool:
+        return self.edge_exists(edge) and self.__graph.is_edge_incidencing_in_vertex(edge, vertex)
+
+    def is_empty(self) -> bool:
+        return not any(self.__is_edge_visible(edge[0], edge[1]) for edge in self.__graph.get_edges())
+
+    def get_vertex_info(self, info: VertexInfoTypes, vertex: Vertex) -> Any:
+        if vertex in self.__excluded_vertices:
+            return None
+        return self.__graph.get_vertex_info(info, vertex)
+
+    def get_edge_info(self, info: EdgeInfoTypes, edge: Edge) -> Any:
+        if not self.__is_edge_visible(edge[0], edge[1]):
+            return None
+        return self.__graph.get_edge_info(info, edge)
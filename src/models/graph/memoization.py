@@ -0,0 +1,41 @@
+import functools
+from collections import OrderedDict
+from typing import Any, Callable
+
+# Memoização de métodos de um grafo: o resultado fica guardado por método e argumentos e só vale enquanto
+# graph.get_version() não mudar; qualquer mudança no grafo descarta os resultados guardados daquele método.
+# Os resultados guardados são compartilhados entre as chamadas, então quem recebe não deve alterá-los.
+# Chamadas com argumentos que não podem ser chave de dicionário (listas, por exemplo) não são guardadas.
+
+MEMOIZATION_ATTRIBUTE = "_memoized_results"
+
+
+def memoize(max_entries: int | None = None) -> Callable:
+    # Com max_entries, só os max_entries argumentos usados mais recentemente ficam guardados (LRU),
+    # para consultas por usuário não crescerem sem limite
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(graph, *args, **kwargs) -> Any:
+            key = (args, tuple(sorted(kwargs.items())))
+            try:
+                hash(key)
+            except TypeError:
+                return method(graph, *args, **kwargs)
+
+            memoized_results = graph.__dict__.setdefault(MEMOIZATION_ATTRIBUTE, {})
+            version = graph.get_version()
+            results_version, results = memoized_results.get(method.__name__, (None, None))
+            if results_version != version:
+                results = OrderedDict()
+                memoized_results[method.__name__] = (version, results)
+            elif key in results:
+                results.move_to_end(key)
+                return results[key]
+
+            result = method(graph, *args, **kwargs)
+            results[key] = result
+            if max_entries is not None and len(results) > max_entries:
+                results.popitem(last=False)
+            return result
+        return wrapper
+    return decorator
@@ -1,240 +1,278 @@
+import csv
+import heapq
+import os
+
+from models.graph.algorithms.articulation_points import find_articulation_points
+from models.graph.algorithms.betweenness import BetweennessResult, betweenness_centrality
+from models.graph.algorithms.bounded_bfs import BoundedBFS
+from models.graph.algorithms.community_detection import CommunityDetectionMode, CommunityDetectionResult, detect_communities
+from models.graph.algorithms.multi_source_bfs import multi_source_closest
+from models.graph.algorithms.pagerank import PageRankResult, pagerank
+from models.graph.algorithms.shortest_paths import DijkstraEngine, WeightTransform, transform_weights
+from models.graph.algorithms.top_neighbors import TopNeighborsResult, top_weighted_neighbors
 from models.graph.graph import Graph
 from models.graph.graph_components.edge import Edge, EdgeInfoTypes
 from models.graph.graph_components.vertex import Vertex, VertexInfoTypes
+from models.graph.graph_representations.graph_representations_types import GraphRepresentationType
+from models.graph.memoization import memoize
+
+# Acima disso o betweenness exato (O(V·E)) fica caro e passa a ser amostrado com essa quantidade de origens
+EXACT_BETWEENNESS_MAX_VERTICES = 2000
+BETWEENNESS_SAMPLES = 500
+# Quantos usuários diferentes cada consulta por usuário (closest_users, ...) guarda enquanto o grafo não muda
+PER_USER_MEMOIZATION_SIZE = 1024
 
 
 class SocialGraph(Graph):
-    def __init__(self, quantity_of_vertices: int):
-        super().__init__(quantity_of_vertices)
+    def __init__(self, quantity_of_vertices: int = 0, representations: set[GraphRepresentationType] = None):
+        super().__init__(quantity_of_vertices, representations)
+        self.__bfs = BoundedBFS()
+        self.__dijkstra = DijkstraEngine()
+        self.__edge_distances: tuple = (None, None, None)
     
     def get_vertex_label(self, vertex: Vertex) -> str:
         return self.get_vertex_info(VertexInfoTypes.LABEL, vertex)
 
     def get_edge_weight(self, edge: Edge) -> int:
-        edge_info = self.get_edge_info(EdgeInfoTypes.WEIGHT, edge)
-        if edge_info is not None:
-            return edge_info
-        inverted_edge = (edge[1], edge[0])
-        edge_info = self.get_edge_info(EdgeInfoTypes.WEIGHT, inverted_edge)
-        if edge_info is not None:
-            return edge_info
-            
-        return 0
+        # As arestas são guardadas na forma canônica, então (a, b) e (b, a) caem no mesmo peso
+        weight = self.get_edge_info(EdgeInfoTypes.WEIGHT, edge)
+        return weight if weight is not None else 0
+
+    def get_directed_edge_weight(self, vertex_a: Vertex, vertex_b: Vertex) -> int:
+        # Peso só das interações de vertex_a para vertex_b, quando o grafo guarda os pesos por sentido
+        info_type = EdgeInfoTypes.FORWARD_WEIGHT if vertex_a <= vertex_b else EdgeInfoTypes.BACKWARD_WEIGHT
+        weight = self.get_edge_info(info_type, (vertex_a, vertex_b))
+        return weight if weight is not None else 0
 
     def get_vertices(self) -> list[Vertex]:
         return list(range(self.quantity_of_vertices))
     
-    def get_edges(self) -> list[Edge]:
-        edges_set = set()
-        for edge in self._Graph__edges_info.keys():
-            normalized_edge = (min(edge[0], edge[1]), max(edge[0], edge[1]))
-            edges_set.add(normalized_edge)
-        return list(edges_set)
-    
     def get_edges_with_weights(self) -> list[tuple[Edge, int]]:
-        edges_weights = []
-        for edge in self.get_edges():
-            weight = self.get_edge_weight(edge)
-            edges_weights.append((edge, weight))
-        return edges_weights
+        return list(zip(self.get_edges(), self.get_edge_weights()))
     
     def get_vertex_degree(self, vertex: Vertex) -> int:
-        degree = 0
-        processed_edges = set()
-        
-        for edge in self._Graph__edges_info.keys():
-            if vertex in edge:
-                normalized_edge = (min(edge[0], edge[1]), max(edge[0], edge[1]))
-                if normalized_edge not in processed_edges:
-                    processed_edges.add(normalized_edge)
-                    degree += 1
-        return degree
+        return self.get_degree(vertex)
     
     def get_vertex_weighted_degree(self, vertex: Vertex) -> int:
-        weighted_degree = 0
-        processed_edges = set()
-        
-        for edge in self._Graph__edges_info.keys():
-            if vertex in edge:
-                normalized_edge = (min(edge[0], edge[1]), max(edge[0], edge[1]))
-                if normalized_edge not in processed_edges:
-                    processed_edges.add(normalized_edge)
-                    weight = self.get_edge_weight(edge)
-                    weighted_degree += weight
-        return weighted_degree
-    
-    def get_neighbors(self, vertex: Vertex) -> list[Vertex]:
-        neighbors = set()
-        for edge in self._Graph__edges_info.keys():
-            if edge[0] == vertex:
-                neighbors.add(edge[1])
-            elif edge[1] == vertex:
-                neighbors.add(edge[0])
-        return list(neighbors)
+        return self.get_weighted_degree(vertex)
     
+    @memoize()
     def most_influential_users(self, top_n: int = 5) -> list[tuple[str, int]]:
-        influence_scores = {}
-        
-        for vertex in self.get_vertices():
-            influence_scores[vertex] = self.get_vertex_weighted_degree(vertex)
-        
-        sorted_vertices = sorted(influence_scores.items(), key=lambda x: x[1], reverse=True)
-        result = []
-        for vertex, score in sorted_vertices[:top_n]:
-            user_label = self.get_vertex_label(vertex)
-            result.append((user_label, score))
-        
-        return result
+        # Top-k com heap sobre os graus ponderados já mantidos pelo grafo: O(V log k)
+        # Em caso de empate vence o vértice de menor id, como na ordenação estável de antes
+        weighted_degrees = self.get_weighted_degrees()
+        top_vertices = heapq.nlargest(top_n, range(self.quantity_of_vertices), key=weighted_degrees.__getitem__)
+        return list(zip(self.labels_for_vertices(top_vertices), (weighted_degrees[vertex] for vertex in top_vertices)))
     
+    @memoize()
+    def pagerank(self, weighted: bool = True, damping: float = 0.85, tolerance: float = 1e-6, max_iterations: int = 100,
+                 initial: PageRankResult | None = None) -> PageRankResult:
+        # Com weighted, a influência passa pelas arestas na proporção dos pesos das interações
+        # Passar o resultado anterior em initial reaproveita o vetor dele depois de uma atualização dos dados
+        offsets, neighbors, weights = self.get_weighted_adjacency_arrays()
+        return pagerank(offsets, neighbors, weights if weighted else None, damping, tolerance, max_iterations,
+                        initial.scores if initial is not None else None)
+
+    @memoize()
+    def influence_scores(self, user_labels: list[str] | None = None) -> dict[str, int]:
+        # Pontuação de influência (grau ponderado) de todos os usuários, ou só dos de user_labels, de uma vez
+        weighted_degrees = self.get_weighted_degrees()
+        if user_labels is None:
+            return dict(zip(self.labels_for_vertices(range(self.quantity_of_vertices)), weighted_degrees))
+        return {label: weighted_degrees[vertex]
+                for label, vertex in zip(user_labels, self.vertices_for_labels(user_labels)) if vertex is not None}
+
+    @memoize()
+    def most_influential_users_by_pagerank(self, top_n: int = 5, weighted: bool = True) -> list[tuple[str, float]]:
+        scores = self.pagerank(weighted).scores
+        top_vertices = heapq.nlargest(top_n, range(self.quantity_of_vertices), key=scores.__getitem__)
+        return list(zip(self.labels_for_vertices(top_vertices), (scores[vertex] for vertex in top_vertices)))
+
+    @memoize()
     def find_communities_simple(self) -> list[list[str]]:
-        # Basicamente uma busca em profundidade até encontrar todos os vértices conectados
-        # Se tiver um vértice não visitado, inicia um novo compontente (comunidade)
-        visited = set()
+        # Os componentes já são mantidos pelo union-find do grafo; só interessam os com 2 ou mais usuários
         communities = []
-        
-        def dfs(vertex, community):
-            visited.add(vertex)
-            community.append(vertex)
-            for neighbor in self.get_neighbors(vertex):
-                if neighbor not in visited:
-                    dfs(neighbor, community)
-        
-        for vertex in self.get_vertices():
-            if vertex not in visited:
-                community = []
-                dfs(vertex, community)
-                if len(community) > 1:
-                    user_community = [self.get_vertex_label(v) for v in community]
-                    communities.append(user_community)
-        
+        for community in self.get_components():
+            if len(community) > 1:
+                communities.append(self.labels_for_vertices(community))
         return communities
-    
+
+    @memoize()
+    def detect_communities(self, mode: CommunityDetectionMode = CommunityDetectionMode.LOUVAIN, seed: int = 0,
+                           resolution: float = 1.0, workers: int | None = None) -> CommunityDetectionResult:
+        offsets, neighbors, weights = self.get_weighted_adjacency_arrays()
+        return detect_communities(offsets, neighbors, weights, mode, seed, resolution, workers)
+
+    @memoize()
+    def find_communities(self, mode: CommunityDetectionMode = CommunityDetectionMode.LOUVAIN, seed: int = 0,
+                         resolution: float = 1.0, workers: int | None = None) -> list[list[str]]:
+        # Comunidades de verdade usando os pesos das interações, e não só os componentes conexos
+        # Como em find_communities_simple, ficam só as com 2 ou mais usuários, na ordem do menor vértice de cada uma
+        members: dict[int, list[Vertex]] = {}
+        for vertex, community in enumerate(self.detect_communities(mode, seed, resolution, workers).communities):
+            members.setdefault(community, []).append(vertex)
+        return [self.labels_for_vertices(community) for community in members.values() if len(community) > 1]
+
+    @memoize()
     def connection_level(self) -> float:
-        # Pega a qtd de usuarios total ai calcula quantos pares são possíveis
-        # Ai para vértice ele faz uma busca em largura pra ver quem ele consegue alcançar
-        # Conta quantos pares de usuários estão conectados (ai pode ser direto ou indireto)
-        # Divide pelo total de pares possíveis
-        vertices = self.get_vertices()
-        n = len(vertices)
-        
+        # Porcentagem dos pares de usuários que estão conectados (direta ou indiretamente)
+        # Dois usuários estão conectados exatamente quando estão no mesmo componente,
+        # então basta somar s*(s-1)/2 pelos tamanhos s dos componentes, sem BFS a partir de cada vértice
+        n = self.get_quantity_of_vertices()
         if n <= 1:
             return 100.0
 
         total_possible_pairs = n * (n - 1) // 2
-        connected_pairs = set()
-        
-        for start_vertex in vertices:
-            visited = set([start_vertex])
-            queue = [start_vertex]
-            
-            while queue:
-                current = queue.pop(0)
-                for neighbor in self.get_neighbors(current):
-                    if neighbor not in visited:
-                        visited.add(neighbor)
-                        queue.append(neighbor)
-                        pair = (min(start_vertex, neighbor), max(start_vertex, neighbor))
-                        connected_pairs.add(pair)
-        
-        connection_percentage = (len(connected_pairs) * 100) / total_possible_pairs
-        return connection_percentage
-    
-    def closest_users(self, user_label: str, top_n: int = 5) -> list[tuple[str, int]]:
-        target_vertex = None
-        for vertex in self.get_vertices():
-            if self.get_vertex_label(vertex) == user_label:
-                target_vertex = vertex
+        connected_pairs = sum(size * (size - 1) // 2 for size in self.component_sizes().values())
+        return (connected_pairs * 100) / total_possible_pairs
+
+    @memoize()
+    def connection_level_by_component(self) -> list[tuple[int, int, float]]:
+        # Quanto cada componente com 2+ usuários contribui para o connection_level:
+        # (tamanho, pares conectados, porcentagem do total de pares), do maior componente para o menor
+        n = self.get_quantity_of_vertices()
+        total_possible_pairs = max(n * (n - 1) // 2, 1)
+        breakdown = []
+        for size in sorted(self.component_sizes().values(), reverse=True):
+            if size < 2:
                 break
-        
+            pairs = size * (size - 1) // 2
+            breakdown.append((size, pairs, (pairs * 100) / total_possible_pairs))
+        return breakdown
+
+    @memoize(max_entries=PER_USER_MEMOIZATION_SIZE)
+    def closest_users(self, user_label: str, top_n: int = 5) -> list[tuple[str, int]]:
+        target_vertex = self.get_vertex_by_label(user_label)
         if target_vertex is None:
             return []
-        
-        scores = {}
-        processed_edges = set()
-        
-        for edge in self._Graph__edges_info.keys():
-            if target_vertex in edge:
-                normalized_edge = (min(edge[0], edge[1]), max(edge[0], edge[1]))
-                if normalized_edge not in processed_edges:
-                    processed_edges.add(normalized_edge)
-                    weight = self.get_edge_weight(edge)
-                    neighbor = edge[1] if edge[0] == target_vertex else edge[0]
-                    scores[neighbor] = scores.get(neighbor, 0) + weight
-        
-        sorted_neighbors = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-        result = []
-        for vertex, score in sorted_neighbors[:top_n]:
-            neighbor_label = self.get_vertex_label(vertex)
-            result.append((neighbor_label, score))
-        
-        return result
+        # Só a linha do usuário no CSR com pesos é percorrida, em vez de todas as arestas do grafo
+        top_neighbors = self.closest_users_for_all(top_n, [user_label]).get(0)
+        return list(zip(self.labels_for_vertices(vertex for vertex, _ in top_neighbors), (score for _, score in top_neighbors)))
+
+    @memoize()
+    def closest_users_for_all(self, top_n: int = 5, user_labels: list[str] | None = None) -> TopNeighborsResult:
+        # Os top_n vizinhos de maior peso de todos os usuários (ou só dos de user_labels que existirem) numa única passada
+        # pelos pesos, O(E log k). Empates de peso saem pelo menor id de vizinho
+        sources = None
+        if user_labels is not None:
+            sources = [vertex for vertex in self.vertices_for_labels(user_labels) if vertex is not None]
+        offsets, neighbors, weights = self.get_weighted_adjacency_arrays()
+        return top_weighted_neighbors(offsets, neighbors, weights, top_n, sources)
+
+    def export_closest_users(self, output_path: str | None = None, top_n: int = 5, user_labels: list[str] | None = None) -> str:
+        # Tabela (usuário, posição, colaborador, peso) em CSV, gerada direto das colunas do resultado em lote
+        if output_path is None:
+            output_path = os.path.join(os.getcwd(), "closest_users.csv")
+        labels = self.labels_for_vertices(range(self.quantity_of_vertices))
+        with open(output_path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(["user", "rank", "collaborator", "weight"])
+            writer.writerows(self.closest_users_for_all(top_n, user_labels).iter_rows(labels))
+        return output_path
     
+    @memoize(max_entries=PER_USER_MEMOIZATION_SIZE)
     def closest_non_direct_users(self, user_label: str, top_n: int = 5) -> list[tuple[str, int]]:
-        target_vertex = None
-        for vertex in self.get_vertices():
-            if self.get_vertex_label(vertex) == user_label:
-                target_vertex = vertex
-                break
-        
+        target_vertex = self.get_vertex_by_label(user_label)
         if target_vertex is None:
             return []
         
-        direct_neighbors = set(self.get_neighbors(target_vertex))
-        direct_neighbors.add(target_vertex)
-        
-        distances = {target_vertex: 0}
-        queue = [target_vertex]
-        visited = set([target_vertex])
-        
-        while queue:
-            current = queue.pop(0)
-            current_distance = distances[current]
-            
-            for neighbor in self.get_neighbors(current):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    distances[neighbor] = current_distance + 1
-                    queue.append(neighbor)
-
-        non_direct_users = []
-        for vertex, distance in distances.items():
-            if vertex not in direct_neighbors and distance > 0:
-                user_label_vertex = self.get_vertex_label(vertex)
-                non_direct_users.append((user_label_vertex, distance))
-        
-        non_direct_users.sort(key=lambda x: x[1])
-        return non_direct_users[:top_n]
+        # Vizinhos diretos estão a distância 1, então os não diretos são os a distância >= 2.
+        # Como a busca em largura os encontra em ordem de distância, ela para assim que tiver top_n deles
+        offsets, neighbors = self.get_adjacency_arrays()
+        non_direct_users = self.__bfs.search(offsets, neighbors, target_vertex, max_results=top_n, min_depth=2)
+        labels = self.labels_for_vertices(vertex for vertex, _ in non_direct_users)
+        return [(label, distance) for label, (_, distance) in zip(labels, non_direct_users)]
+
+    @memoize()
+    def closest_non_direct_users_for_all(self, user_labels: list[str] | None = None, top_n: int = 5,
+                                         batch_size: int = 256) -> dict[str, list[tuple[str, int]]]:
+        # closest_non_direct_users para muitos usuários de uma vez (todos, se user_labels for None), com uma busca
+        # em largura de várias origens por lote. Empates de distância saem por id do vértice, e não pela ordem de
+        # descoberta como na versão de um usuário só, então a escolha entre empatados pode ser diferente
+        if user_labels is None:
+            sources = list(range(self.quantity_of_vertices))
+            user_labels = self.labels_for_vertices(sources)
+        else:
+            user_labels = [label for label, vertex in zip(user_labels, self.vertices_for_labels(user_labels)) if vertex is not None]
+            sources = self.vertices_for_labels(user_labels)
+        offsets, neighbors = self.get_adjacency_arrays()
+        report = {}
+        for user_label, closest in zip(user_labels, multi_source_closest(offsets, neighbors, sources, top_n, 2, batch_size)):
+            labels = self.labels_for_vertices(vertex for vertex, _ in closest)
+            report[user_label] = [(label, distance) for label, (_, distance) in zip(labels, closest)]
+        return report
+
+    def __get_distance_arrays(self, transform: WeightTransform) -> tuple:
+        # As distâncias transformadas valem enquanto o grafo devolver o mesmo array de pesos
+        offsets, neighbors, weights = self.get_weighted_adjacency_arrays()
+        cached_weights, cached_transform, distances = self.__edge_distances
+        if cached_weights is not weights or cached_transform != transform:
+            distances = transform_weights(weights, transform)
+            self.__edge_distances = (weights, transform, distances)
+        return offsets, neighbors, distances
+
+    @memoize(max_entries=PER_USER_MEMOIZATION_SIZE)
+    def closest_users_weighted(self, user_label: str, top_n: int = 5,
+                               transform: WeightTransform = WeightTransform.INVERSE) -> list[tuple[str, float]]:
+        # Proximidade considerando a força das interações em vários passos: a distância de um caminho é a soma
+        # das distâncias das arestas (por padrão 1/peso). A busca para assim que fixa os top_n mais próximos
+        target_vertex = self.get_vertex_by_label(user_label)
+        if target_vertex is None:
+            return []
+        offsets, neighbors, distances = self.__get_distance_arrays(transform)
+        closest = self.__dijkstra.search(offsets, neighbors, distances, target_vertex, max_results=top_n)
+        labels = self.labels_for_vertices(vertex for vertex, _ in closest)
+        return [(label, distance) for label, (_, distance) in zip(labels, closest)]
 
+    def weighted_distances(self, user_label: str, target_labels: list[str],
+                           transform: WeightTransform = WeightTransform.INVERSE) -> list[float | None]:
+        # Distâncias de um usuário para vários outros numa única busca, que para quando todos forem alcançados
+        # None para usuários desconhecidos ou que não podem ser alcançados
+        source = self.get_vertex_by_label(user_label)
+        targets = self.vertices_for_labels(target_labels)
+        if source is None:
+            return [None] * len(targets)
+        offsets, neighbors, distances = self.__get_distance_arrays(transform)
+        found = dict(self.__dijkstra.search(offsets, neighbors, distances, source,
+                                            targets=[target for target in targets if target is not None]))
+        found[source] = 0.0
+        return [found.get(target) if target is not None else None for target in targets]
+
+    @memoize()
+    def fragmentation_scores(self) -> list[int]:
+        # Quantos componentes a mais (contando só os com 2+ usuários) aparecem se cada vértice sair do grafo, indexado pelo vértice
+        offsets, neighbors = self.get_adjacency_arrays()
+        return find_articulation_points(offsets, neighbors).fragmentation_scores
+
+    @memoize()
+    def articulation_points(self) -> list[str]:
+        offsets, neighbors = self.get_adjacency_arrays()
+        return self.labels_for_vertices(find_articulation_points(offsets, neighbors).articulation_points)
+
+    @memoize()
+    def betweenness_centrality(self, samples: int | None = None, seed: int = 0, normalized: bool = True,
+                               workers: int | None = None) -> BetweennessResult:
+        offsets, neighbors = self.get_adjacency_arrays()
+        return betweenness_centrality(offsets, neighbors, samples, seed, normalized, workers)
+
+    @memoize()
+    def find_bridge_users(self, top_n: int = 5, seed: int = 0, workers: int | None = None) -> list[tuple[str, float]]:
+        # Usuários que mais aparecem nos caminhos mínimos entre os outros, ou seja, que ligam subcomunidades
+        # Exato em grafos pequenos, amostrado nos grandes (o erro máximo fica em betweenness_centrality().error_bound)
+        samples = None if self.quantity_of_vertices <= EXACT_BETWEENNESS_MAX_VERTICES else BETWEENNESS_SAMPLES
+        scores = self.betweenness_centrality(samples, seed, workers=workers).scores
+        top_vertices = heapq.nlargest(top_n, range(self.quantity_of_vertices), key=scores.__getitem__)
+        return list(zip(self.labels_for_vertices(top_vertices), (scores[vertex] for vertex in top_vertices)))
+
+    @memoize()
     def find_most_fragmenting_user(self) -> tuple[str, int]:
-        # Pega os componentes conectados originais
-        # Ai remove vértice por vértice e vê qual acaba gerando mais componentes
-        # O usuário que mais fragmenta basicamente seria o usuário que mais gera novos componentes
-        original_components = len(self.find_communities_simple())
+        # O usuário que mais fragmenta é o que gera mais componentes novos ao ser removido
+        # Os scores saem de uma única passada de pontos de articulação, sem remover vértice por vértice
         max_fragmentation = 0
         most_fragmenting_user = None
-        
-        for vertex in self.get_vertices():
-            edges_to_remove = []
-            edges_info_backup = {}
-            
-            for edge in list(self._Graph__edges_info.keys()):
-                if vertex in edge:
-                    edges_to_remove.append(edge)
-                    edges_info_backup[edge] = self._Graph__edges_info[edge].copy()
-            
-            for edge in edges_to_remove:
-                del self._Graph__edges_info[edge]
-                self.delete_edge(edge[0], edge[1])
-            
-            new_components = len(self.find_communities_simple())
-            fragmentation = new_components - original_components
-            
+        for vertex, fragmentation in enumerate(self.fragmentation_scores()):
             if fragmentation > max_fragmentation:
                 max_fragmentation = fragmentation
                 most_fragmenting_user = self.get_vertex_label(vertex)
-            
-            for edge in edges_to_remove:
-                self.create_edge(edge[0], edge[1])
-                self._Graph__edges_info[edge] = edges_info_backup[edge]
         
         return most_fragmenting_user, max_fragmentation
\ No newline at end of file